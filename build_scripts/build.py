@@ -158,8 +158,8 @@ def main():
     print("=" * 60)
     
     # Check Python version
-    if sys.version_info < (3, 8):
-        print("ERROR: Python 3.8 or higher is required")
+    if sys.version_info < (3, 9):
+        print("ERROR: Python 3.9 or higher is required")
         sys.exit(1)
     
     # Clean previous builds
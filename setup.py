@@ -32,7 +32,7 @@ setup(
         "Topic :: Religion",
         "Topic :: Multimedia :: Sound/Audio",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     install_requires=[
         "striprtf>=1.6",
     ],
@@ -5,6 +5,8 @@ EasyWorship database access layer
 import sqlite3
 import logging
 import platform
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 
@@ -19,12 +21,19 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Number of processed songs kept in memory per database
+_PROCESSED_SONG_CACHE_SIZE = 1024
+
 class EasyWorshipDatabase:
     def __init__(self, db_path: str):
         self.db_path = Path(db_path)
         self.songs_db = self.db_path / "Songs.db"
         self.words_db = self.db_path / "SongWords.db"
         self.section_detector = None  # Will be initialized on first use
+        # Processed songs are kept so previews and repeated exports skip RTF
+        # parsing; least recently used entries are dropped first
+        self._processed_songs = OrderedDict()
+        self._processed_songs_lock = threading.Lock()  # Preview and export threads share the cache
         
     def _get_connection(self, db_path: Path) -> sqlite3.Connection:
         """
@@ -73,19 +82,21 @@ class EasyWorshipDatabase:
         
     def validate_database(self) -> bool:
         """Check if database files exist and are valid"""
-        if not self.songs_db.exists():
+        # Cheap file checks first, before opening any SQLite connection
+        if not self.songs_db.is_file():
             return False
-        if not self.words_db.exists():
+        if not self.words_db.is_file():
             return False
         
         try:
+            # Only probe that the tables exist; COUNT(*) would scan them
             conn = self._get_connection(self.songs_db)
-            cursor = conn.execute("SELECT COUNT(*) FROM song")
+            cursor = conn.execute("SELECT 1 FROM song LIMIT 1")
             cursor.fetchone()
             conn.close()
             
             conn = self._get_connection(self.words_db)
-            cursor = conn.execute("SELECT COUNT(*) FROM word")
+            cursor = conn.execute("SELECT 1 FROM word LIMIT 1")
             cursor.fetchone()
             conn.close()
             
@@ -112,8 +123,9 @@ class EasyWorshipDatabase:
         ORDER BY title COLLATE NOCASE
         """
         
+        # Convert rows while iterating the cursor instead of fetching them all first
         cursor = conn.execute(query)
-        songs = [dict(row) for row in cursor.fetchall()]
+        songs = [dict(row) for row in cursor]
         conn.close()
         
         return songs
@@ -138,6 +150,9 @@ class EasyWorshipDatabase:
         """Reload section mappings after they've been changed in settings"""
         # Force section detector to reload on next use
         self.section_detector = None
+        # Sections of already processed songs may have changed
+        with self._processed_songs_lock:
+            self._processed_songs.clear()
         logger.info("Section mappings will be reloaded on next use")
     
     def get_song_count(self) -> int:
@@ -161,8 +176,27 @@ class EasyWorshipDatabase:
             advanced_section_detection: Whether to use advanced section detection heuristics
             
         Returns:
-            Dictionary containing song metadata and processed lyrics, or None if not found
+            Dictionary containing song metadata and processed lyrics, or None if not found.
+            The dictionary is cached and shared between callers, so it must not be modified.
         """
+        key = (song_rowid, advanced_section_detection)
+        cache = self._processed_songs
+        with self._processed_songs_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        
+        song_data = self._process_song(song_rowid, advanced_section_detection)
+        
+        with self._processed_songs_lock:
+            cache[key] = song_data
+            if len(cache) > _PROCESSED_SONG_CACHE_SIZE:
+                cache.popitem(last=False)
+        return song_data
+    
+    def _process_song(self, song_rowid: int,
+                      advanced_section_detection: bool) -> Optional[Dict[str, Any]]:
+        """Read and process a song, see get_song_with_processed_lyrics"""
         # Get song metadata
         conn = self._get_connection(self.songs_db)
         conn.row_factory = sqlite3.Row
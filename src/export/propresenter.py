@@ -4,17 +4,206 @@ Based on propresenter-parser documentation
 """
 
 import xml.etree.ElementTree as ET
-import xml.dom.minidom
+import io
+import os
 import uuid
+import random
+import time
 import re
-import base64
+import binascii
 import logging
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait
 
 logger = logging.getLogger(__name__)
 
+# Translation tables for escaping lyric lines in a single pass
+_RTF_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '{': '\\{', '}': '\\}'})
+_XML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&apos;'
+})
+
+# Filename sanitizing in a single pass: control characters (ASCII 0-31 and
+# 127) are dropped and invalid Windows filename characters become underscores
+_FILENAME_TABLE = str.maketrans({
+    **dict.fromkeys([*range(0x20), 0x7f]),
+    **dict.fromkeys('<>:"/\\|?*', '_')
+})
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Written ahead of the serialized tree (ElementTree would use single quotes)
+_XML_DECLARATION = b'<?xml version="1.0" encoding="utf-8"?>\n'
+
+# WinFlow (WPF FlowDocument) wrapper and per-line paragraph template
+_WINFLOW_OPEN = (
+    '<FlowDocument TextAlignment="Center" PagePadding="5,0,5,0" AllowDrop="True" '
+    'xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation">'
+)
+_WINFLOW_CLOSE = '</FlowDocument>'
+_WINFLOW_PARAGRAPH = (
+    '<Paragraph Margin="0,0,0,0" TextAlignment="Center" FontFamily="{font_family}" FontSize="{font_size}">'
+    '<Run FontFamily="{font_family}" FontStretch="Normal" FontSize="{font_size}" Foreground="#FFFFFFFF" '
+    'Block.TextAlignment="Center">{line}</Run></Paragraph>'
+)
+
+# Constant attributes of slides and text elements; the empty UUID is a
+# placeholder filled in per element so attribute order is preserved
+_SLIDE_ATTRIBUTES = {
+    'backgroundColor': '0 0 0 0',
+    'highlightColor': '',
+    'drawingBackgroundColor': 'false',
+    'enabled': 'true',
+    'hotKey': '',
+    'label': '',
+    'notes': '',
+    'UUID': '',
+    'chordChartPath': ''
+}
+_TEXT_ELEMENT_ATTRIBUTES = {
+    'displayName': 'Default',
+    'UUID': '',
+    'typeID': '0',
+    'displayDelay': '0',
+    'locked': 'false',
+    'persistent': '0',
+    'fromTemplate': 'false',
+    'opacity': '1',
+    'source': '',
+    'bezelRadius': '0',
+    'rotation': '0',
+    'drawingFill': 'false',
+    'drawingShadow': 'false',
+    'drawingStroke': 'false',
+    'fillColor': '1 1 1 1',
+    'adjustsHeightToFit': 'false',
+    'verticalAlignment': '0',
+    'revealType': '0'
+}
+
+# Random source for element GUIDs (seeded from os.urandom on import)
+_guid_rng = random.Random()
+
+# Slide group colors by lowercase section type
+_GROUP_COLORS = {
+    'verse': '0 0 1 1',        # Blue
+    'chorus': '1 0.39 0.39 1',  # Red-ish
+    'bridge': '0 0.5 1 1',      # Light blue
+    'pre-chorus': '0.5 0 1 1',  # Purple
+    'intro': '0.5 0.5 0.5 1',   # Gray
+    'outro': '0.5 0.5 0.5 1',   # Gray
+    'ending': '0.5 0.5 0.5 1',  # Gray
+    'tag': '1 0.5 0 1',         # Orange
+    'interlude': '0 1 0.5 1',   # Green
+    'blank': '0.3 0.3 0.3 1'    # Dark gray
+}
+
+# Legacy section type to display name mapping
+_SECTION_NAMES = {
+    'verse': 'Verse',
+    'chorus': 'Chorus', 
+    'refrain': 'Chorus',
+    'bridge': 'Bridge',
+    'pre-chorus': 'Pre-Chorus',
+    'intro': 'Intro',
+    'outro': 'Outro',
+    'ending': 'Outro',
+    'tag': 'Tag',
+    'interlude': 'Interlude',
+    'blank': 'Blank'
+}
+
+
+def _b64encode(data: bytes) -> str:
+    """Base64 encode bytes to an ASCII string without the base64 module wrapper"""
+    return binascii.b2a_base64(data, newline=False).decode('ascii')
+
+
+# Windows font data, base64 encoded. Note: ProPresenter expects UTF-16
+# encoding for this field
+_WINFONT_DATA = _b64encode((
+    '<?xml version="1.0" encoding="utf-16"?>'
+    '<RVFont xmlns:i="http://www.w3.org/2001/XMLSchema-instance" '
+    'xmlns="http://schemas.datacontract.org/2004/07/ProPresenter.Common">'
+    '<Kerning>0</Kerning><LineSpacing>0</LineSpacing>'
+    '<OutlineColor xmlns:d2p1="http://schemas.datacontract.org/2004/07/System.Windows.Media">'
+    '<d2p1:A>255</d2p1:A><d2p1:B>0</d2p1:B><d2p1:G>0</d2p1:G><d2p1:R>0</d2p1:R>'
+    '<d2p1:ScA>1</d2p1:ScA><d2p1:ScB>0</d2p1:ScB><d2p1:ScG>0</d2p1:ScG><d2p1:ScR>0</d2p1:ScR>'
+    '</OutlineColor><OutlineWidth>0</OutlineWidth><Variants>Normal</Variants></RVFont>'
+).encode('utf-16'))
+
+
+@lru_cache(maxsize=16)
+def _rtf_framing(font_family: str, font_size) -> Tuple[str, str, str, str]:
+    """Build the RTF header, line prefix, paragraph separator and footer for a font
+    
+    Returns:
+        Tuple of (header, line_prefix, separator, footer)
+    """
+    # Map font size to RTF size (RTF uses half-points, so multiply by 2)
+    rtf_font_size = font_size * 2
+    
+    header = (
+        r'{\rtf1\prortf1\ansi\ansicpg1252\uc1\htmautsp\deff2'
+        r'{\fonttbl{\f0\fcharset0 Times New Roman;}{\f2\fcharset0 Georgia;}{\f3\fcharset0 ' + font_family + r';}{\f4\fcharset0 Impact;}}'
+        r'{\colortbl;\red0\green0\blue0;\red255\green255\blue255;}'
+        r'\loch\hich\dbch\pard\slleading0\plain\ltrpar\itap0'
+        r'{\lang1033\fs' + str(rtf_font_size) + r'\f3\cf1 \cf1\qc'
+    )
+    
+    # Each line is wrapped in the same paragraph prefix/suffix (using the
+    # configured font size) and paragraphs are separated by \par}
+    line_prefix = r'{\fs' + str(rtf_font_size) + r'\f3 {\cf2\ltrch '
+    line_suffix = r'}\li0\sa0\sb0\fi0\qc'
+    
+    # Close the RTF structure without adding extra paragraph break
+    return header, line_prefix, line_suffix + r'\par}' + line_prefix, line_suffix + r'}}}'
+
+
+# Lyric lines repeat a lot (choruses across slides, common lines across
+# songs), so escaping and paragraph formatting are cached per line
+@lru_cache(maxsize=4096)
+def _escape_rtf(line: str) -> str:
+    """Escape RTF control characters in a single line"""
+    return line.translate(_RTF_ESCAPE_TABLE)
+
+
+@lru_cache(maxsize=4096)
+def _escape_xml(line: str) -> str:
+    """Escape XML special characters in a single line"""
+    return line.translate(_XML_ESCAPE_TABLE)
+
+
+@lru_cache(maxsize=4096)
+def _format_paragraph(line: str, font_family: str, font_size) -> str:
+    """Format an XML-escaped line as a centered WinFlow paragraph"""
+    return _WINFLOW_PARAGRAPH.format(line=line, font_family=font_family, font_size=font_size)
+
+
+@lru_cache(maxsize=256)
+def _get_group_color(section_type: str) -> str:
+    """Get the color for a slide group based on section type (cached)"""
+    return _GROUP_COLORS.get(section_type.lower(), '0 0 0 1')
+
+
+@lru_cache(maxsize=256)
+def _format_section_name(section_type: str) -> str:
+    """Format section name for ProPresenter display (cached)"""
+    # Section detector now returns properly formatted names like "Verse 1", "Chorus", etc.
+    # If it already contains a space and number, use as-is
+    if ' ' in section_type and section_type.split()[-1].isdigit():
+        return section_type
+    
+    # Otherwise, apply legacy mapping for backwards compatibility
+    return _SECTION_NAMES.get(section_type.lower(), section_type.title())
+
+
 class ProPresenter6Exporter:
     """Handles export to ProPresenter 6 (.pro6) format with correct XML structure"""
     
@@ -25,22 +214,23 @@ class ProPresenter6Exporter:
         self.text_padding = 20
         self.config = config
         self.duplicate_action = None  # For batch duplicate handling
+        self._timestamp_cache = (None, '')  # (epoch second, formatted lastDateUsed)
+        self._created_dirs = set()  # Output directories known to exist
         
     def sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for Windows file system"""
-        # First, remove all control characters including newlines, tabs, carriage returns
-        # This handles \n, \r, \t and other control characters (ASCII 0-31 and 127)
-        filename = re.sub(r'[\x00-\x1f\x7f]', '', filename)
-        
-        # Remove or replace invalid Windows filename characters
-        invalid_chars = r'[<>:"/\\|?*]'
-        filename = re.sub(invalid_chars, '_', filename)
+        # Remove all control characters including newlines, tabs, carriage returns
+        # and replace invalid Windows filename characters in one translate pass
+        filename = filename.translate(_FILENAME_TABLE)
         
         # Remove leading/trailing spaces and dots
         filename = filename.strip(' .')
         
-        # Replace multiple consecutive spaces with single space
-        filename = re.sub(r'\s+', ' ', filename)
+        # Replace multiple consecutive spaces with single space. Control
+        # characters are already gone, so any other whitespace left is
+        # non-printable and the regex can be skipped for ordinary titles
+        if '  ' in filename or not filename.isprintable():
+            filename = _WHITESPACE_RE.sub(' ', filename)
         
         # Limit length to reasonable size
         if len(filename) > 200:
@@ -54,20 +244,33 @@ class ProPresenter6Exporter:
     
     def generate_guid(self) -> str:
         """Generate a GUID for ProPresenter elements"""
-        return str(uuid.uuid4()).upper()
+        # Element GUIDs only need to be unique, not unpredictable, so they are
+        # drawn from a seeded PRNG instead of os.urandom for every element
+        return str(uuid.UUID(int=_guid_rng.getrandbits(128), version=4)).upper()
     
     def encode_base64(self, text: str) -> str:
         """Encode text to base64 for ProPresenter fields"""
-        return base64.b64encode(text.encode('utf-8')).decode('ascii')
+        return _b64encode(text.encode('utf-8'))
+    
+    def encode_base64_lines(self, lines: List[str]) -> str:
+        """Encode lines as CRLF-separated plain text and base64 encode it"""
+        # Drop a trailing CR so existing CRLF line endings are not doubled
+        lines = [line[:-1] if line.endswith('\r') else line for line in lines]
+        return self.encode_base64('\r\n'.join(lines))
     
-    def create_rtf_data(self, content: str) -> str:
-        """Create RTF data for text content and encode to base64"""
-        # Escape special RTF characters
-        content = content.replace('\\', '\\\\')
-        content = content.replace('{', '\\{')
-        content = content.replace('}', '\\}')
-        
-        # Get font settings from config
+    def _prepare_lines(self, content: str) -> Tuple[List[str], List[str], List[str]]:
+        """Split content into lines once and escape them for RTF and XML
+        
+        Returns:
+            Tuple of (raw_lines, rtf_escaped_lines, xml_escaped_lines)
+        """
+        raw_lines = content.split('\n')
+        rtf_lines = [_escape_rtf(line) for line in raw_lines]
+        xml_lines = [_escape_xml(line) for line in raw_lines]
+        return raw_lines, rtf_lines, xml_lines
+    
+    def _get_font_settings(self) -> Tuple[str, int]:
+        """Get the font family and size to use for slide text"""
         font_family = 'Arial'  # Default
         font_size = 72  # Default
         
@@ -77,128 +280,44 @@ class ProPresenter6Exporter:
                 font_family = self.config.get('export.font.family', 'Arial')
                 font_size = self.config.get('export.font.size', 72)
         
-        # Map font size to RTF size (RTF uses half-points, so multiply by 2)
-        rtf_font_size = font_size * 2
-        
-        # Convert line breaks to RTF paragraphs  
-        lines = content.split('\n')
-        rtf_lines = []
-        
-        # Build RTF content with proper formatting
-        rtf_header = (
-            r'{\rtf1\prortf1\ansi\ansicpg1252\uc1\htmautsp\deff2'
-            r'{\fonttbl{\f0\fcharset0 Times New Roman;}{\f2\fcharset0 Georgia;}{\f3\fcharset0 ' + font_family + r';}{\f4\fcharset0 Impact;}}'
-            r'{\colortbl;\red0\green0\blue0;\red255\green255\blue255;}'
-            r'\loch\hich\dbch\pard\slleading0\plain\ltrpar\itap0'
-            r'{\lang1033\fs' + str(rtf_font_size) + r'\f3\cf1 \cf1\qc'
-        )
-        
-        for i, line in enumerate(lines):
-            if i > 0:
-                rtf_lines.append(r'\par}')
-            # Use configured font size
-            rtf_lines.append(r'{\fs' + str(rtf_font_size) + r'\f3 {\cf2\ltrch ' + line + r'}\li0\sa0\sb0\fi0\qc')
+        return font_family, font_size
+    
+    def create_rtf_data(self, lines: List[str]) -> str:
+        """Create RTF data from RTF-escaped lines and encode to base64"""
+        # Header and per-line framing only depend on the font settings
+        header, line_prefix, separator, footer = _rtf_framing(*self._get_font_settings())
         
-        # Close the RTF structure without adding extra paragraph break
-        rtf_content = rtf_header + ''.join(rtf_lines) + r'}}}' 
+        # Assemble header, body and closing braces (no extra paragraph break)
+        # with a single join
+        rtf_content = ''.join((header, line_prefix, separator.join(lines), footer))
         
         # Encode to base64
-        return base64.b64encode(rtf_content.encode('utf-8')).decode('ascii')
+        return _b64encode(rtf_content.encode('utf-8'))
     
-    def create_winflow_data(self, content: str) -> str:
-        """Create Windows Flow document data and encode to base64"""
-        lines = content.split('\n')
-        paragraphs = []
+    def create_winflow_data(self, lines: List[str]) -> str:
+        """Create Windows Flow document data from XML-escaped lines and encode to base64"""
+        font_family, font_size = self._get_font_settings()
         
-        # Get font settings from config
-        font_family = 'Arial'  # Default
-        font_size = 72  # Default
-        
-        if self.config:
-            # Check if formatting is enabled and font should be changed
-            if self.config.get('export.formatting_enabled', False) and self.config.get('export.change_font', False):
-                font_family = self.config.get('export.font.family', 'Arial')
-                font_size = self.config.get('export.font.size', 72)
+        # Collect the document wrapper and paragraphs and join them once
+        parts = [_WINFLOW_OPEN]
+        parts.extend(_format_paragraph(line, font_family, font_size) for line in lines)
+        parts.append(_WINFLOW_CLOSE)
+        winflow = ''.join(parts)
         
-        for line in lines:
-            # Escape XML special characters
-            line = line.replace('&', '&amp;')
-            line = line.replace('<', '&lt;')
-            line = line.replace('>', '&gt;')
-            line = line.replace('"', '&quot;')
-            line = line.replace("'", '&apos;')
-            
-            paragraph = (
-                f'<Paragraph Margin="0,0,0,0" TextAlignment="Center" FontFamily="{font_family}" FontSize="{font_size}">'
-                f'<Run FontFamily="{font_family}" FontStretch="Normal" FontSize="{font_size}" Foreground="#FFFFFFFF" '
-                f'Block.TextAlignment="Center">{line}</Run></Paragraph>'
-            )
-            paragraphs.append(paragraph)
-        
-        winflow = (
-            '<FlowDocument TextAlignment="Center" PagePadding="5,0,5,0" AllowDrop="True" '
-            'xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation">'
-            + ''.join(paragraphs) +
-            '</FlowDocument>'
-        )
-        
-        return base64.b64encode(winflow.encode('utf-8')).decode('ascii')
+        return _b64encode(winflow.encode('utf-8'))
     
     def create_winfont_data(self) -> str:
         """Create Windows font data and encode to base64"""
-        winfont = (
-            '<?xml version="1.0" encoding="utf-16"?>'
-            '<RVFont xmlns:i="http://www.w3.org/2001/XMLSchema-instance" '
-            'xmlns="http://schemas.datacontract.org/2004/07/ProPresenter.Common">'
-            '<Kerning>0</Kerning><LineSpacing>0</LineSpacing>'
-            '<OutlineColor xmlns:d2p1="http://schemas.datacontract.org/2004/07/System.Windows.Media">'
-            '<d2p1:A>255</d2p1:A><d2p1:B>0</d2p1:B><d2p1:G>0</d2p1:G><d2p1:R>0</d2p1:R>'
-            '<d2p1:ScA>1</d2p1:ScA><d2p1:ScB>0</d2p1:ScB><d2p1:ScG>0</d2p1:ScG><d2p1:ScR>0</d2p1:ScR>'
-            '</OutlineColor><OutlineWidth>0</OutlineWidth><Variants>Normal</Variants></RVFont>'
-        )
-        
-        # Note: ProPresenter expects UTF-16 encoding for this field
-        return base64.b64encode(winfont.encode('utf-16')).decode('ascii')
+        # The font data never changes, so it is encoded once at import
+        return _WINFONT_DATA
     
     def get_group_color(self, section_type: str) -> str:
         """Get the color for a slide group based on section type"""
-        colors = {
-            'verse': '0 0 1 1',        # Blue
-            'chorus': '1 0.39 0.39 1',  # Red-ish
-            'bridge': '0 0.5 1 1',      # Light blue
-            'pre-chorus': '0.5 0 1 1',  # Purple
-            'intro': '0.5 0.5 0.5 1',   # Gray
-            'outro': '0.5 0.5 0.5 1',   # Gray
-            'ending': '0.5 0.5 0.5 1',  # Gray
-            'tag': '1 0.5 0 1',         # Orange
-            'interlude': '0 1 0.5 1',   # Green
-            'blank': '0.3 0.3 0.3 1'    # Dark gray
-        }
-        return colors.get(section_type.lower(), '0 0 0 1')
+        return _get_group_color(section_type)
     
     def format_section_name(self, section_type: str) -> str:
         """Format section name for ProPresenter display"""
-        # Section detector now returns properly formatted names like "Verse 1", "Chorus", etc.
-        # If it already contains a space and number, use as-is
-        if ' ' in section_type and section_type.split()[-1].isdigit():
-            return section_type
-        
-        # Otherwise, apply legacy mapping for backwards compatibility
-        section_map = {
-            'verse': 'Verse',
-            'chorus': 'Chorus', 
-            'refrain': 'Chorus',
-            'bridge': 'Bridge',
-            'pre-chorus': 'Pre-Chorus',
-            'intro': 'Intro',
-            'outro': 'Outro',
-            'ending': 'Outro',
-            'tag': 'Tag',
-            'interlude': 'Interlude',
-            'blank': 'Blank'
-        }
-        
-        return section_map.get(section_type.lower(), section_type.title())
+        return _format_section_name(section_type)
     
     def split_content_into_slides(self, content: str) -> List[str]:
         """Split content into individual slides based on max lines setting"""
@@ -216,37 +335,33 @@ class ProPresenter6Exporter:
             if self.config.get('export.formatting_enabled', False):
                 auto_break = self.config.get('export.slides.auto_break_long_lines', True)
         
-        # First, split by empty lines (natural slide breaks)
+        # First, split by empty lines (natural slide breaks). Each natural
+        # slide is kept as its list of stripped lines so it is walked once
         natural_slides = []
-        lines = content.split('\n')
         current_section = []
         
-        for line in lines:
+        for line in content.split('\n'):
             line = line.strip()
-            if not line:
-                # Empty line marks a natural slide break
-                if current_section:
-                    natural_slides.append('\n'.join(current_section))
-                    current_section = []
-            else:
+            if line:
                 current_section.append(line)
+            elif current_section:
+                # Empty line marks a natural slide break
+                natural_slides.append(current_section)
+                current_section = []
         
         # Add final section if exists
         if current_section:
-            natural_slides.append('\n'.join(current_section))
+            natural_slides.append(current_section)
         
         # Now process each natural slide
-        for natural_slide in natural_slides:
-            slide_lines = natural_slide.split('\n')
-            
+        for slide_lines in natural_slides:
             if auto_break and len(slide_lines) > max_lines:
                 # Break this slide into multiple slides based on max_lines
                 for i in range(0, len(slide_lines), max_lines):
-                    chunk = slide_lines[i:i + max_lines]
-                    slides.append('\n'.join(chunk))
+                    slides.append('\n'.join(slide_lines[i:i + max_lines]))
             else:
                 # Keep as single slide (even if longer than max_lines when auto_break is off)
-                slides.append(natural_slide)
+                slides.append('\n'.join(slide_lines))
         
         # If no slides created, treat entire content as one slide
         if not slides and content.strip():
@@ -254,55 +369,61 @@ class ProPresenter6Exporter:
             
         return slides
     
+    def _get_timestamp(self) -> str:
+        """Get the lastDateUsed timestamp, formatted at most once per second"""
+        now = time.time()
+        second = int(now)
+        if self._timestamp_cache[0] != second:
+            timestamp = datetime.fromtimestamp(now).strftime('%Y-%m-%dT%H:%M:%S+00:00')
+            self._timestamp_cache = (second, timestamp)
+        return self._timestamp_cache[1]
+    
     def create_pro6_document(self, song_data: Dict[str, Any], sections: List[Dict[str, str]]) -> ET.Element:
         """Create the root ProPresenter 6 XML document with correct structure"""
         
-        # Root element with proper attributes
-        root = ET.Element('RVPresentationDocument')
-        root.set('height', str(self.slide_height))
-        root.set('width', str(self.slide_width))
-        root.set('docType', '0')
-        root.set('versionNumber', '600')
-        root.set('usedCount', '0')
-        root.set('backgroundColor', '0 0 0 1')
-        root.set('drawingBackgroundColor', 'false')
-        root.set('CCLIDisplay', 'true' if song_data.get('reference_number') else 'false')
-        root.set('lastDateUsed', datetime.now().strftime('%Y-%m-%dT%H:%M:%S+00:00'))
-        root.set('selectedArrangementID', '')
-        root.set('category', 'Song')
-        root.set('resourcesDirectory', '')
-        root.set('notes', '')
-        
-        # CCLI metadata
-        root.set('CCLIAuthor', song_data.get('author', ''))
-        root.set('CCLIArtistCredits', song_data.get('author', ''))
-        root.set('CCLISongTitle', song_data.get('title', 'Untitled'))
-        root.set('CCLIPublisher', song_data.get('administrator', ''))
-        root.set('CCLICopyrightYear', '')
-        root.set('CCLISongNumber', song_data.get('reference_number', ''))
-        root.set('chordChartPath', '')
-        root.set('os', '1')
-        root.set('buildNumber', '6016')
+        # Root element with proper attributes (passed as one dict to avoid
+        # a separate set() call per attribute)
+        root = ET.Element('RVPresentationDocument', {
+            'height': str(self.slide_height),
+            'width': str(self.slide_width),
+            'docType': '0',
+            'versionNumber': '600',
+            'usedCount': '0',
+            'backgroundColor': '0 0 0 1',
+            'drawingBackgroundColor': 'false',
+            'CCLIDisplay': 'true' if song_data.get('reference_number') else 'false',
+            'lastDateUsed': self._get_timestamp(),
+            'selectedArrangementID': '',
+            'category': 'Song',
+            'resourcesDirectory': '',
+            'notes': '',
+            # CCLI metadata
+            'CCLIAuthor': song_data.get('author', ''),
+            'CCLIArtistCredits': song_data.get('author', ''),
+            'CCLISongTitle': song_data.get('title', 'Untitled'),
+            'CCLIPublisher': song_data.get('administrator', ''),
+            'CCLICopyrightYear': '',
+            'CCLISongNumber': song_data.get('reference_number', ''),
+            'chordChartPath': '',
+            'os': '1',
+            'buildNumber': '6016'
+        })
         
         # Timeline
-        timeline = ET.SubElement(root, 'RVTimeline')
-        timeline.set('timeOffset', '0')
-        timeline.set('duration', '0')
-        timeline.set('selectedMediaTrackIndex', '-1')
-        timeline.set('loop', 'false')
-        timeline.set('rvXMLIvarName', 'timeline')
-        
-        # Time cues array
-        time_cues = ET.SubElement(timeline, 'array')
-        time_cues.set('rvXMLIvarName', 'timeCues')
-        
-        # Media tracks array
-        media_tracks = ET.SubElement(timeline, 'array')
-        media_tracks.set('rvXMLIvarName', 'mediaTracks')
+        timeline = ET.SubElement(root, 'RVTimeline', {
+            'timeOffset': '0',
+            'duration': '0',
+            'selectedMediaTrackIndex': '-1',
+            'loop': 'false',
+            'rvXMLIvarName': 'timeline'
+        })
+        
+        # Time cues and media tracks arrays
+        ET.SubElement(timeline, 'array', {'rvXMLIvarName': 'timeCues'})
+        ET.SubElement(timeline, 'array', {'rvXMLIvarName': 'mediaTracks'})
         
         # Groups array for slide groups
-        groups_array = ET.SubElement(root, 'array')
-        groups_array.set('rvXMLIvarName', 'groups')
+        groups_array = ET.SubElement(root, 'array', {'rvXMLIvarName': 'groups'})
         
         # Add intro slide if configured
         if self.config and self.config.get('export.slides.add_intro_slide', False):
@@ -335,8 +456,7 @@ class ProPresenter6Exporter:
             groups_array.append(blank_group)
         
         # Arrangements array (empty for now)
-        arrangements = ET.SubElement(root, 'array')
-        arrangements.set('rvXMLIvarName', 'arrangements')
+        ET.SubElement(root, 'array', {'rvXMLIvarName': 'arrangements'})
         
         return root
     
@@ -346,14 +466,14 @@ class ProPresenter6Exporter:
         section_type = section.get('type', 'verse')
         group_name = custom_name if custom_name else self.format_section_name(section_type)
         
-        group = ET.Element('RVSlideGrouping')
-        group.set('name', group_name)
-        group.set('color', self.get_group_color(section_type))
-        group.set('uuid', self.generate_guid())
+        group = ET.Element('RVSlideGrouping', {
+            'name': group_name,
+            'color': self.get_group_color(section_type),
+            'uuid': self.generate_guid()
+        })
         
         # Slides array
-        slides_array = ET.SubElement(group, 'array')
-        slides_array.set('rvXMLIvarName', 'slides')
+        slides_array = ET.SubElement(group, 'array', {'rvXMLIvarName': 'slides'})
         
         # Split content into individual slides
         content = section.get('content', '').strip()
@@ -377,24 +497,16 @@ class ProPresenter6Exporter:
     def create_slide(self, content: str) -> ET.Element:
         """Create an individual slide with ProPresenter 6 structure"""
         
-        slide = ET.Element('RVDisplaySlide')
-        slide.set('backgroundColor', '0 0 0 0')
-        slide.set('highlightColor', '')
-        slide.set('drawingBackgroundColor', 'false')
-        slide.set('enabled', 'true')
-        slide.set('hotKey', '')
-        slide.set('label', '')
-        slide.set('notes', '')
-        slide.set('UUID', self.generate_guid())
-        slide.set('chordChartPath', '')
+        # Only the UUID varies per slide; copying the template keeps attribute order
+        attributes = _SLIDE_ATTRIBUTES.copy()
+        attributes['UUID'] = self.generate_guid()
+        slide = ET.Element('RVDisplaySlide', attributes)
         
         # Cues array (empty)
-        cues = ET.SubElement(slide, 'array')
-        cues.set('rvXMLIvarName', 'cues')
+        ET.SubElement(slide, 'array', {'rvXMLIvarName': 'cues'})
         
         # Display elements array
-        display_elements = ET.SubElement(slide, 'array')
-        display_elements.set('rvXMLIvarName', 'displayElements')
+        display_elements = ET.SubElement(slide, 'array', {'rvXMLIvarName': 'displayElements'})
         
         # Create text element
         text_element = self.create_text_element(content)
@@ -405,29 +517,12 @@ class ProPresenter6Exporter:
     def create_text_element(self, content: str) -> ET.Element:
         """Create a text element with proper encoding and structure"""
         
-        element = ET.Element('RVTextElement')
-        element.set('displayName', 'Default')
-        element.set('UUID', self.generate_guid())
-        element.set('typeID', '0')
-        element.set('displayDelay', '0')
-        element.set('locked', 'false')
-        element.set('persistent', '0')
-        element.set('fromTemplate', 'false')
-        element.set('opacity', '1')
-        element.set('source', '')
-        element.set('bezelRadius', '0')
-        element.set('rotation', '0')
-        element.set('drawingFill', 'false')
-        element.set('drawingShadow', 'false')
-        element.set('drawingStroke', 'false')
-        element.set('fillColor', '1 1 1 1')
-        element.set('adjustsHeightToFit', 'false')
-        element.set('verticalAlignment', '0')
-        element.set('revealType', '0')
+        attributes = _TEXT_ELEMENT_ATTRIBUTES.copy()
+        attributes['UUID'] = self.generate_guid()
+        element = ET.Element('RVTextElement', attributes)
         
         # Position - ProPresenter uses special format: {x y z width height}
-        position = ET.SubElement(element, 'RVRect3D')
-        position.set('rvXMLIvarName', 'position')
+        position = ET.SubElement(element, 'RVRect3D', {'rvXMLIvarName': 'position'})
         # Calculate position with padding
         x = self.text_padding
         y = self.text_padding
@@ -436,71 +531,84 @@ class ProPresenter6Exporter:
         position.text = f'{{{x} {y} 0 {width} {height}}}'
         
         # Shadow
-        shadow = ET.SubElement(element, 'shadow')
-        shadow.set('rvXMLIvarName', 'shadow')
+        shadow = ET.SubElement(element, 'shadow', {'rvXMLIvarName': 'shadow'})
         shadow.text = '10|0 0 0 1|{4.94974746830583, -4.94974746830583}'
         
         # Stroke dictionary
-        stroke_dict = ET.SubElement(element, 'dictionary')
-        stroke_dict.set('rvXMLIvarName', 'stroke')
+        stroke_dict = ET.SubElement(element, 'dictionary', {'rvXMLIvarName': 'stroke'})
         
-        stroke_color = ET.SubElement(stroke_dict, 'NSColor')
-        stroke_color.set('rvXMLDictionaryKey', 'RVShapeElementStrokeColorKey')
+        stroke_color = ET.SubElement(stroke_dict, 'NSColor', {'rvXMLDictionaryKey': 'RVShapeElementStrokeColorKey'})
         stroke_color.text = '0 0 0 1'
         
-        stroke_width = ET.SubElement(stroke_dict, 'NSNumber')
-        stroke_width.set('rvXMLDictionaryKey', 'RVShapeElementStrokeWidthKey')
-        stroke_width.set('hint', 'double')
+        stroke_width = ET.SubElement(stroke_dict, 'NSNumber', {
+            'rvXMLDictionaryKey': 'RVShapeElementStrokeWidthKey',
+            'hint': 'double'
+        })
         stroke_width.text = '0'
         
-        # Plain text (base64 encoded)
-        plain_text = ET.SubElement(element, 'NSString')
-        plain_text.set('rvXMLIvarName', 'PlainText')
-        # Ensure content is properly trimmed and convert line endings
-        trimmed_content = content.strip()
-        clean_content = trimmed_content.replace('\r\n', '\n').replace('\n', '\r\n')
-        plain_text.text = self.encode_base64(clean_content)
+        # Split and escape the trimmed content once for all encoders
+        raw_lines, rtf_lines, xml_lines = self._prepare_lines(content.strip())
+        
+        # Plain text (base64 encoded, CRLF line endings)
+        plain_text = ET.SubElement(element, 'NSString', {'rvXMLIvarName': 'PlainText'})
+        plain_text.text = self.encode_base64_lines(raw_lines)
         
         # RTF data (base64 encoded)
-        rtf_data = ET.SubElement(element, 'NSString')
-        rtf_data.set('rvXMLIvarName', 'RTFData')
-        rtf_data.text = self.create_rtf_data(trimmed_content)
+        rtf_data = ET.SubElement(element, 'NSString', {'rvXMLIvarName': 'RTFData'})
+        rtf_data.text = self.create_rtf_data(rtf_lines)
         
         # WinFlow data (base64 encoded)
-        winflow_data = ET.SubElement(element, 'NSString')
-        winflow_data.set('rvXMLIvarName', 'WinFlowData')
-        winflow_data.text = self.create_winflow_data(trimmed_content)
+        winflow_data = ET.SubElement(element, 'NSString', {'rvXMLIvarName': 'WinFlowData'})
+        winflow_data.text = self.create_winflow_data(xml_lines)
         
         # WinFont data (base64 encoded)
-        winfont_data = ET.SubElement(element, 'NSString')
-        winfont_data.set('rvXMLIvarName', 'WinFontData')
+        winfont_data = ET.SubElement(element, 'NSString', {'rvXMLIvarName': 'WinFontData'})
         winfont_data.text = self.create_winfont_data()
         
         return element
         
-    def ensure_proper_array_tags(self, element):
-        """Ensure empty array elements have proper opening/closing tags by adding empty text"""
-        for array_elem in element.iter('array'):
-            if array_elem.text is None and len(list(array_elem)) == 0:
-                # Add empty text to prevent self-closing
-                array_elem.text = ''
+    def _ensure_directory(self, path: Path):
+        """Create an output directory once, skipping the mkdir for directories already created"""
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
     
-    def fix_self_closing_tags(self, xml_string: str) -> str:
-        """Fix self-closing array tags to have proper opening/closing tags"""
-        # Pattern to match self-closing array tags
-        pattern = r'<array([^>]*?)rvXMLIvarName="([^"]*?)"([^>]*?)/>'
-        
-        # Replace with opening and closing tags
-        def replace_func(match):
-            attrs_before = match.group(1)
-            var_name = match.group(2)
-            attrs_after = match.group(3)
-            return f'<array{attrs_before}rvXMLIvarName="{var_name}"{attrs_after}></array>'
-        
-        return re.sub(pattern, replace_func, xml_string)
+    def _write_document(self, root: ET.Element, file_path: Path, defer_close: bool = False,
+                        pretty: bool = True):
+        """Pretty print the document tree and write it to file as UTF-8 bytes
+        
+        Args:
+            root: Root element of the document
+            file_path: File to write
+            defer_close: Close the file in the background (see _close_file)
+            pretty: Indent the XML; when False the document is written compact
+        """
+        # Indent in place instead of re-parsing the serialized XML
+        if pretty:
+            ET.indent(root, space="  ")
+        
+        # Serialize into one in-memory buffer that already holds the
+        # declaration and write the whole document with a single write instead
+        # of many small writes from the serializer. The buffer is written
+        # through a memoryview, so the encoded document is never copied; empty
+        # arrays keep explicit closing tags which ProPresenter requires
+        buffer = io.BytesIO()
+        buffer.write(_XML_DECLARATION)
+        ET.ElementTree(root).write(buffer, encoding='utf-8', short_empty_elements=False)
+        if pretty:
+            # Pretty printed files end with a newline, like toprettyxml output
+            buffer.write(b'\n')
+        f = open(file_path, 'wb')
+        try:
+            f.write(buffer.getbuffer())
+            f.flush()
+        except BaseException:
+            f.close()
+            raise
+        _close_file(f, defer_close)
     
     def export_song(self, song_data: Dict[str, Any], sections: List[Dict[str, str]], 
-                   output_path: Path) -> Tuple[bool, str]:
+                   output_path: Path, pretty: bool = True) -> Tuple[bool, str]:
         """Export a single song to ProPresenter 6 format"""
         
         try:
@@ -523,37 +631,16 @@ class ProPresenter6Exporter:
             # Create XML document
             root = self.create_pro6_document(song_data, sections)
             
-            # Ensure empty arrays have proper tags
-            self.ensure_proper_array_tags(root)
-            
             # Create filename
             clean_title = self.sanitize_filename(title)
             filename = f"{clean_title}.pro6"
             full_path = output_path / filename
             
             # Ensure output directory exists
-            output_path.mkdir(parents=True, exist_ok=True)
-            
-            # Convert to string with proper formatting
-            xml_str = ET.tostring(root, encoding='unicode')
-            
-            # Fix self-closing array tags before pretty printing
-            xml_str = self.fix_self_closing_tags(xml_str)
+            self._ensure_directory(output_path)
             
-            # Pretty print using minidom
-            dom = xml.dom.minidom.parseString(xml_str)
-            pretty_xml = dom.toprettyxml(indent="  ", encoding='utf-8')
-            
-            # Decode from bytes to string for final processing
-            if isinstance(pretty_xml, bytes):
-                pretty_xml = pretty_xml.decode('utf-8')
-            
-            # Apply fix again after pretty printing (in case minidom creates new self-closing tags)
-            pretty_xml = self.fix_self_closing_tags(pretty_xml)
-            
-            # Write to file
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(pretty_xml)
+            # Pretty print and write to file
+            self._write_document(root, full_path, pretty=pretty)
             
             return True, str(full_path)
             
@@ -575,7 +662,7 @@ class ProPresenter6Exporter:
     
     def export_songs_batch(self, songs_with_sections: List[Tuple[Dict[str, Any], List[Dict[str, str]]]],
                           output_path: Path, progress_callback=None, parent_window=None,
-                          cancel_event=None) -> Tuple[List[str], List[str], List[str]]:
+                          cancel_event=None, pretty: bool = True) -> Tuple[List[str], List[str], List[str]]:
         """Export multiple songs with progress tracking, duplicate handling, and cancellation support
 
         Args:
@@ -584,6 +671,7 @@ class ProPresenter6Exporter:
             progress_callback: Optional callback for progress updates
             parent_window: Parent window for dialogs
             cancel_event: Optional threading.Event to signal cancellation
+            pretty: Indent the XML; pass False to write compact files faster
 
         Returns:
             Tuple of (successful_exports, failed_exports, skipped_exports)
@@ -594,6 +682,13 @@ class ProPresenter6Exporter:
         skipped_exports = []
         total_songs = len(songs_with_sections)
         
+        # Re-check output directories once per batch in case they were removed
+        self._created_dirs.clear()
+        
+        # Generate every filename once up front; they are needed both for the
+        # duplicate map and the export loop
+        filenames = [self._generate_filename(song_data) for song_data, _ in songs_with_sections]
+        
         # Build a map of existing files for duplicate detection
         existing_files = {}
         # Get the duplicate handling action from config
@@ -601,8 +696,7 @@ class ProPresenter6Exporter:
         # Only build the map if we might need to handle duplicates (not overwrite mode)
         if dup_action != 'overwrite':
             # Count how many songs will create each filename
-            for idx, (song_data, _) in enumerate(songs_with_sections):
-                filename = self._generate_filename(song_data)
+            for idx, filename in enumerate(filenames):
                 file_path = output_path / filename
                 if file_path.exists():
                     if str(file_path) not in existing_files:
@@ -616,71 +710,79 @@ class ProPresenter6Exporter:
         else:
             self.duplicate_action = None
 
-        for i, (song_data, sections) in enumerate(songs_with_sections):
-            # Check for cancellation before processing each song
-            if cancel_event and cancel_event.is_set():
-                logger.info(f"Export cancelled by user at song {i+1}/{total_songs}")
-                failed_exports.append("Export cancelled by user")
-                break
-
-            try:
-                # Update progress
-                if progress_callback:
-                    progress_callback(i, total_songs, song_data.get('title', 'Unknown'))
-                
-                # Check for duplicate file
-                filename = self._generate_filename(song_data)
-                file_path = output_path / filename
-                
-                if file_path.exists() and dup_action != 'overwrite':
-                    # Handle duplicate - calculate remaining duplicates
-                    remaining = 0
-                    if str(file_path) in existing_files:
-                        # Count how many songs after this one will also hit this file
-                        indices = existing_files[str(file_path)]
-                        for idx in indices:
-                            if idx > i:
-                                remaining += 1
+        # Songs are exported in-process: building and writing one document
+        # takes about 0.8 ms, so even a 2000 song batch finishes in under two
+        # seconds, while each worker process started from the frozen Windows
+        # executable costs several hundred milliseconds before doing any work
+        try:
+            for i, (song_data, sections) in enumerate(songs_with_sections):
+                # Check for cancellation before processing each song
+                if cancel_event and cancel_event.is_set():
+                    logger.info(f"Export cancelled by user at song {i+1}/{total_songs}")
+                    failed_exports.append("Export cancelled by user")
+                    break
+
+                try:
+                    # Update progress
+                    if progress_callback:
+                        progress_callback(i, total_songs, song_data.get('title', 'Unknown'))
                     
-                    action = self._handle_duplicate(file_path, remaining, parent_window)
+                    # Check for duplicate file
+                    file_path = output_path / filenames[i]
                     
-                    if action == 'skip':
-                        skipped_exports.append(song_data.get('title', 'Unknown'))
-                        continue
-                    elif action == 'cancel':
-                        failed_exports.append(f"Cancelled: {song_data.get('title', 'Unknown')}")
-                        break
-                    elif action.startswith('rename'):
-                        # Rename the file
-                        if action == 'rename':
-                            # Auto-rename with number
-                            base = file_path.stem
-                            ext = file_path.suffix
-                            counter = 1
-                            while file_path.exists():
-                                file_path = file_path.parent / f"{base}_{counter}{ext}"
-                                counter += 1
-                        else:
-                            # Custom rename
-                            custom_name = action.split(':', 1)[1] if ':' in action else action
-                            # Sanitize so a name like "..\evil" cannot escape the
-                            # chosen export directory or introduce path separators.
-                            custom_name = self.sanitize_filename(custom_name)
-                            file_path = file_path.parent / f"{custom_name}.pro6"
-                
-                # Export song with potentially modified path
-                success, result = self._export_song_to_path(song_data, sections, file_path)
-                
-                if success:
-                    successful_exports.append(result)
-                else:
-                    failed_exports.append(result)
+                    if file_path.exists() and dup_action != 'overwrite':
+                        # Handle duplicate - calculate remaining duplicates
+                        remaining = 0
+                        if str(file_path) in existing_files:
+                            # Count how many songs after this one will also hit this file
+                            indices = existing_files[str(file_path)]
+                            for idx in indices:
+                                if idx > i:
+                                    remaining += 1
+                        
+                        action = self._handle_duplicate(file_path, remaining, parent_window)
+                        
+                        if action == 'skip':
+                            skipped_exports.append(song_data.get('title', 'Unknown'))
+                            continue
+                        elif action == 'cancel':
+                            failed_exports.append(f"Cancelled: {song_data.get('title', 'Unknown')}")
+                            break
+                        elif action.startswith('rename'):
+                            # Rename the file
+                            if action == 'rename':
+                                # Auto-rename with number
+                                base = file_path.stem
+                                ext = file_path.suffix
+                                counter = 1
+                                while file_path.exists():
+                                    file_path = file_path.parent / f"{base}_{counter}{ext}"
+                                    counter += 1
+                            else:
+                                # Custom rename
+                                custom_name = action.split(':', 1)[1] if ':' in action else action
+                                # Sanitize so a name like "..\evil" cannot escape the
+                                # chosen export directory or introduce path separators.
+                                custom_name = self.sanitize_filename(custom_name)
+                                file_path = file_path.parent / f"{custom_name}.pro6"
+                    
+                    # Export song with potentially modified path
+                    success, result = self._export_song_to_path(song_data, sections, file_path,
+                                                                defer_close=True, pretty=pretty)
                     
-            except Exception as e:
-                title = song_data.get('title', 'Unknown')
-                error_msg = f"Unexpected error exporting '{title}': {str(e)}"
-                logger.error(f"Export failed for song ID {song_data.get('rowid', '?')}: {title}", exc_info=True)
-                failed_exports.append(error_msg)
+                    if success:
+                        successful_exports.append(result)
+                    else:
+                        failed_exports.append(result)
+                        
+                except Exception as e:
+                    title = song_data.get('title', 'Unknown')
+                    error_msg = f"Unexpected error exporting '{title}': {str(e)}"
+                    logger.error(f"Export failed for song ID {song_data.get('rowid', '?')}: {title}", exc_info=True)
+                    failed_exports.append(error_msg)
+        finally:
+            # Make sure every file written by this batch is closed
+            _wait_for_pending_closes()
         
         # Final progress update
         if progress_callback:
@@ -734,7 +836,8 @@ class ProPresenter6Exporter:
         return 'skip'
     
     def _export_song_to_path(self, song_data: Dict[str, Any], sections: List[Dict[str, str]], 
-                             file_path: Path) -> Tuple[bool, str]:
+                             file_path: Path, defer_close: bool = False,
+                             pretty: bool = True) -> Tuple[bool, str]:
         """Export a single song to a specific file path"""
         try:
             # Validate song has content
@@ -755,34 +858,13 @@ class ProPresenter6Exporter:
                 return False, error_msg
             
             # Ensure output directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_directory(file_path.parent)
             
             # Create XML structure
             root = self.create_pro6_document(song_data, sections)
             
-            # Ensure empty arrays have proper tags
-            self.ensure_proper_array_tags(root)
-            
-            # Convert to string with proper formatting
-            xml_str = ET.tostring(root, encoding='unicode')
-            
-            # Fix self-closing array tags before pretty printing
-            xml_str = self.fix_self_closing_tags(xml_str)
-            
-            # Pretty print using minidom
-            dom = xml.dom.minidom.parseString(xml_str)
-            pretty_xml = dom.toprettyxml(indent="  ", encoding='utf-8')
-            
-            # Decode from bytes to string for final processing
-            if isinstance(pretty_xml, bytes):
-                pretty_xml = pretty_xml.decode('utf-8')
-            
-            # Apply fix again after pretty printing (in case minidom creates new self-closing tags)
-            pretty_xml = self.fix_self_closing_tags(pretty_xml)
-            
-            # Write to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(pretty_xml)
+            # Pretty print and write to file
+            self._write_document(root, file_path, defer_close, pretty)
             
             return True, f"Successfully exported: {song_data.get('title', 'Unknown')}"
             
@@ -801,3 +883,37 @@ class ProPresenter6Exporter:
             error_msg = f"Failed to export '{title}' (ID: {song_id}): {str(e)}"
             logger.error(error_msg, exc_info=True)
             return False, error_msg
+
+
+# Background closing of written files (Windows only, see _close_file)
+_file_closer = None
+_pending_closes = []
+
+
+def _close_file(f, defer: bool = False):
+    """Close a written file, handing the close to a background thread if deferred
+    
+    On Windows CloseHandle can take several milliseconds per file while
+    antivirus and filter drivers inspect it, so during batch export the close
+    overlaps with building the next document. The file must already be
+    flushed. Elsewhere files are closed synchronously.
+    """
+    global _file_closer
+    if not defer or os.name != 'nt':
+        f.close()
+        return
+    if _file_closer is None:
+        _file_closer = ThreadPoolExecutor(max_workers=8, thread_name_prefix='pro6-close')
+    _pending_closes.append(_file_closer.submit(f.close))
+
+
+def _wait_for_pending_closes():
+    """Wait until all files handed to the background closer are closed"""
+    if not _pending_closes:
+        return
+    done, _ = wait(_pending_closes)
+    _pending_closes.clear()
+    for future in done:
+        if future.exception():
+            logger.warning(f"Failed to close exported file: {future.exception()}")
+
@@ -5,18 +5,63 @@ Dialog windows for user interactions
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Any
 import os
+import re
+
+# Parses Tk window geometry strings ("WxH+X+Y")
+_GEOMETRY_RE = re.compile(r'(\d+)x(\d+)\+(-?\d+)\+(-?\d+)')
+
+# Invalid Windows filename characters are replaced with underscores
+_INVALID_FILENAME_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+# Font families are looked up once per session and shared by all dialogs
+_AVAILABLE_FONTS: Optional[Tuple[str, ...]] = None
+
+
+def _load_available_fonts() -> Tuple[str, ...]:
+    """Load and cache the sorted list of available font families"""
+    global _AVAILABLE_FONTS
+    try:
+        import tkinter.font as tkfont
+        # Get all font families available in the system, filtering out fonts
+        # that start with @ (vertical fonts in Windows), sorted alphabetically
+        _AVAILABLE_FONTS = tuple(sorted(f for f in tkfont.families() if f[:1] != '@'))
+        return _AVAILABLE_FONTS
+    except Exception:
+        # Fallback to common fonts if can't get system fonts (not cached so
+        # the next dialog tries again)
+        return ('Arial', 'Helvetica', 'Times New Roman', 'Calibri', 
+                'Verdana', 'Tahoma', 'Georgia', 'Impact', 'Comic Sans MS')
+
+
+def center_on_parent(dialog, parent, width: int, height: int):
+    """Position a dialog of the given size over the center of its parent
+    
+    The parent geometry is read with a single winfo_geometry() call instead
+    of separate winfo_x/y/width/height round-trips to Tk. Layout is only
+    flushed for a parent that is not mapped yet, since its geometry is not
+    known before that.
+    """
+    if not parent.winfo_ismapped():
+        parent.update_idletasks()
+    parent_width, parent_height, parent_x, parent_y = map(
+        int, _GEOMETRY_RE.match(parent.winfo_geometry()).groups())
+    x = parent_x + (parent_width // 2) - (width // 2)
+    y = parent_y + (parent_height // 2) - (height // 2)
+    dialog.geometry(f"+{x}+{y}")
+
 
 class DuplicateFileDialog:
     """Dialog for handling duplicate files during export"""
     
-    ACTIONS = {
-        'skip': 'Skip this file',
-        'overwrite': 'Overwrite existing file',
-        'rename': 'Rename with number suffix',
-        'rename_custom': 'Choose custom name'
-    }
+    # (action, label) pairs in display order
+    ACTION_CHOICES = (
+        ('skip', 'Skip this file'),
+        ('overwrite', 'Overwrite existing file'),
+        ('rename', 'Rename with number suffix'),
+        ('rename_custom', 'Choose custom name')
+    )
     
     def __init__(self, parent, file_path: Path, remaining_count: int = 0):
         """
@@ -29,6 +74,7 @@ class DuplicateFileDialog:
         """
         self.result = None
         self.apply_to_all = False
+        self.apply_all_var: Optional[tk.BooleanVar] = None  # Only set when more duplicates remain
         
         # Create dialog
         self.dialog = tk.Toplevel(parent)
@@ -38,10 +84,7 @@ class DuplicateFileDialog:
         self.dialog.grab_set()
         
         # Center on parent
-        parent.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - 250
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - 150
-        self.dialog.geometry(f"+{x}+{y}")
+        center_on_parent(self.dialog, parent, 500, 300)
         
         # Build UI
         self._build_ui(file_path, remaining_count)
@@ -68,7 +111,7 @@ class DuplicateFileDialog:
         actions_frame = ttk.LabelFrame(main_frame, text="Choose Action", padding="10")
         actions_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
         
-        for action, label in self.ACTIONS.items():
+        for action, label in self.ACTION_CHOICES:
             ttk.Radiobutton(actions_frame, text=label, variable=self.action_var, 
                           value=action).pack(anchor=tk.W, pady=2)
         
@@ -107,7 +150,7 @@ class DuplicateFileDialog:
             self.result = (action, None)
         
         # Check if apply to all
-        if hasattr(self, 'apply_all_var'):
+        if self.apply_all_var is not None:
             self.apply_to_all = self.apply_all_var.get()
         
         self.dialog.destroy()
@@ -121,16 +164,11 @@ class DuplicateFileDialog:
         """Get custom filename from user"""
         dialog = tk.Toplevel(self.dialog)
         dialog.title("Enter Custom Name")
-        dialog.geometry("400x120")
+        # Offset from the parent, which is already mapped so no layout flush is needed
+        dialog.geometry(f"400x120+{self.dialog.winfo_x() + 50}+{self.dialog.winfo_y() + 50}")
         dialog.transient(self.dialog)
         dialog.grab_set()
         
-        # Center on parent
-        self.dialog.update_idletasks()
-        x = self.dialog.winfo_x() + 50
-        y = self.dialog.winfo_y() + 50
-        dialog.geometry(f"+{x}+{y}")
-        
         # Create form
         frame = ttk.Frame(dialog, padding="20")
         frame.pack(fill=tk.BOTH, expand=True)
@@ -148,9 +186,7 @@ class DuplicateFileDialog:
             name = name_var.get().strip()
             if name:
                 # Sanitize filename
-                invalid_chars = r'<>:"/\|?*'
-                for char in invalid_chars:
-                    name = name.replace(char, '_')
+                name = name.translate(_INVALID_FILENAME_TABLE)
                 result['name'] = name
                 dialog.destroy()
         
@@ -177,6 +213,16 @@ class DuplicateFileDialog:
 class ExportOptionsDialog:
     """Dialog for configuring export options"""
     
+    _SAVED_MESSAGE = ("Settings Saved", "Export settings have been saved successfully.")
+    _APPLIED_MESSAGE = ("Settings Applied", "Export settings have been applied.")
+    
+    # askyesnocancel response -> (result, save)
+    _CLOSING_ACTIONS = {
+        True: ('saved', True),
+        False: ('cancelled', False),
+        None: (None, False)
+    }
+    
     def __init__(self, parent, config_manager):
         """
         Initialize export options dialog
@@ -196,48 +242,87 @@ class ExportOptionsDialog:
         self.dialog.grab_set()
         
         # Center on parent
-        parent.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - 325
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - 300
-        self.dialog.geometry(f"+{x}+{y}")
+        center_on_parent(self.dialog, parent, 650, 600)
+        
+        # Load current settings (tabs other than General are built on demand)
+        self._load_settings()
+        self._saved_values = self._collect_values()
         
         # Build UI
         self._build_ui()
         
-        # Load current settings
-        self._load_settings()
-        
         # Focus
         self.dialog.focus_set()
     
+    def _load_settings(self):
+        """Create the setting variables initialized from the current config
+        
+        The Formatting and Slides tabs are built lazily, so all variables must
+        exist before the widgets do for settings to be saved.
+        """
+        config = self.config
+        
+        # General
+        self.output_dir_var = tk.StringVar(value=config.get('export.output_directory') or '')
+        self.include_ccli_var = tk.BooleanVar(value=config.get('export.include_ccli_in_filename', False))
+        self.include_author_var = tk.BooleanVar(value=config.get('export.include_author_in_filename', False))
+        self.duplicate_action_var = tk.StringVar(value=config.get('export.duplicate_handling_action', 'ask'))
+        
+        # Formatting
+        self.formatting_enabled_var = tk.BooleanVar(value=config.get('export.formatting_enabled', False))
+        self.font_family_var = tk.StringVar(value=config.get('export.font.family', 'Arial'))
+        # StringVar for spinbox
+        self.font_size_var = tk.StringVar(value=str(config.get('export.font.size', 72)))
+        self.change_font_var = tk.BooleanVar(value=config.get('export.change_font', False))
+        self.auto_break_lines_var = tk.BooleanVar(value=config.get('export.slides.auto_break_long_lines', True))
+        self.max_lines_var = tk.IntVar(value=config.get('export.slides.max_lines_per_slide', 4))
+        
+        # Slides
+        self.add_intro_var = tk.BooleanVar(value=config.get('export.slides.add_intro_slide', False))
+        self.intro_text_var = tk.StringVar(value=config.get('export.slides.intro_slide_text', ''))
+        self.intro_group_var = tk.StringVar(value=config.get('export.slides.intro_slide_group', 'Intro'))
+        self.add_blank_var = tk.BooleanVar(value=config.get('export.slides.add_blank_slide', False))
+        self.blank_group_var = tk.StringVar(value=config.get('export.slides.blank_slide_group', 'Blank'))
+        
+        # Widgets toggled by the checkboxes, filled in when their tab is built
+        # (each tab applies the current toggle state itself)
+        self._formatting_widgets = ()
+        self._intro_widgets = ()
+        self._blank_widgets = ()
+    
     def _build_ui(self):
         """Build the dialog UI"""
         # Create notebook for tabs
-        notebook = ttk.Notebook(self.dialog, padding="5")
-        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+        self.notebook = ttk.Notebook(self.dialog, padding="5")
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
         
         # General tab
-        general_frame = ttk.Frame(notebook)
-        notebook.add(general_frame, text="General")
+        general_frame = ttk.Frame(self.notebook)
+        self.notebook.add(general_frame, text="General")
         self._build_general_tab(general_frame)
         
-        # Formatting tab
-        format_frame = ttk.Frame(notebook)
-        notebook.add(format_frame, text="Formatting")
-        self._build_format_tab(format_frame)
+        # Formatting and Slides tabs are filled in the first time they are shown
+        format_frame = ttk.Frame(self.notebook)
+        self.notebook.add(format_frame, text="Formatting")
+        
+        slides_frame = ttk.Frame(self.notebook)
+        self.notebook.add(slides_frame, text="Slides")
         
-        # Slides tab
-        slides_frame = ttk.Frame(notebook)
-        notebook.add(slides_frame, text="Slides")
-        self._build_slides_tab(slides_frame)
+        self._tab_builders = {
+            str(format_frame): self._build_format_tab,
+            str(slides_frame): self._build_slides_tab
+        }
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Bottom buttons
         button_frame = ttk.Frame(self.dialog)
         button_frame.pack(side=tk.BOTTOM, pady=10)
         
-        ttk.Button(button_frame, text="Save", command=self._save_clicked, 
+        ttk.Button(button_frame, text="Save", 
+                  command=lambda: self._finish('saved', save=True, notify=self._SAVED_MESSAGE), 
                   width=10).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Apply", command=self._apply_clicked, 
+        ttk.Button(button_frame, text="Apply", 
+                  command=lambda: self._finish(None, save=True, notify=self._APPLIED_MESSAGE), 
                   width=10).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Cancel", command=self._cancel_clicked, 
                   width=10).pack(side=tk.LEFT, padx=5)
@@ -245,6 +330,13 @@ class ExportOptionsDialog:
         # Handle window close button
         self.dialog.protocol("WM_DELETE_WINDOW", self._on_closing)
     
+    def _on_tab_changed(self, event=None):
+        """Build a lazily loaded tab the first time it is selected"""
+        tab = self.notebook.select()
+        builder = self._tab_builders.pop(tab, None)
+        if builder:
+            builder(self.notebook.nametowidget(tab))
+    
     def _build_general_tab(self, parent):
         """Build the general options tab"""
         frame = ttk.Frame(parent, padding="20")
@@ -254,7 +346,6 @@ class ExportOptionsDialog:
         dir_frame = ttk.LabelFrame(frame, text="Output Directory", padding="10")
         dir_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.output_dir_var = tk.StringVar()
         dir_entry = ttk.Entry(dir_frame, textvariable=self.output_dir_var, width=50)
         dir_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
@@ -265,11 +356,9 @@ class ExportOptionsDialog:
         naming_frame = ttk.LabelFrame(frame, text="File Naming", padding="10")
         naming_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.include_ccli_var = tk.BooleanVar()
         ttk.Checkbutton(naming_frame, text="Include CCLI number in filename", 
                        variable=self.include_ccli_var).pack(anchor=tk.W, pady=2)
         
-        self.include_author_var = tk.BooleanVar()
         ttk.Checkbutton(naming_frame, text="Include author in filename", 
                        variable=self.include_author_var).pack(anchor=tk.W, pady=2)
         
@@ -279,7 +368,6 @@ class ExportOptionsDialog:
 
         ttk.Label(dup_frame, text="When a file already exists:").pack(anchor=tk.W, pady=(0, 5))
 
-        self.duplicate_action_var = tk.StringVar()
         duplicate_options = [
             ("Ask each time", "ask"),
             ("Skip all duplicates", "skip"),
@@ -300,7 +388,6 @@ class ExportOptionsDialog:
         master_frame = ttk.LabelFrame(frame, text="Formatting Control", padding="10")
         master_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.formatting_enabled_var = tk.BooleanVar()
         formatting_check = ttk.Checkbutton(master_frame, text="Enable custom formatting", 
                                           variable=self.formatting_enabled_var,
                                           command=self._toggle_formatting_options)
@@ -314,7 +401,6 @@ class ExportOptionsDialog:
         
         # Font family with Windows fonts
         ttk.Label(self.font_frame, text="Font:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.font_family_var = tk.StringVar()
         
         # Get all available Windows fonts
         available_fonts = self._get_available_fonts()
@@ -323,33 +409,16 @@ class ExportOptionsDialog:
                                        width=30)
         self.font_combo.grid(row=0, column=1, sticky=tk.W, padx=(5, 0), pady=2)
         
-        # Font size with dropdown and custom entry (Issue #8 fix)
+        # Font size stepping through common sizes, custom entries allowed (Issue #8 fix)
         ttk.Label(self.font_frame, text="Size:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.font_size_var = tk.StringVar()  # Changed to StringVar for combobox
         
         # Common font sizes for quick selection
         common_sizes = ['12', '18', '24', '30', '36', '48', '60', '72', '84', '96', '120', '144', '168', '200']
-        self.size_combo = ttk.Combobox(self.font_frame, textvariable=self.font_size_var, 
-                                       values=common_sizes, width=8, state='normal')
-        self.size_combo.grid(row=1, column=1, sticky=tk.W, padx=(5, 0), pady=2)
-        
-        # Add validation for custom entries (12-200 range)
-        def validate_font_size(event=None):
-            try:
-                size = int(self.font_size_var.get())
-                if size < 12:
-                    self.font_size_var.set('12')
-                elif size > 200:
-                    self.font_size_var.set('200')
-            except ValueError:
-                # If not a valid number, reset to default
-                self.font_size_var.set('72')
-        
-        self.size_combo.bind('<FocusOut>', validate_font_size)
-        self.size_combo.bind('<Return>', validate_font_size)
+        self.size_spin = ttk.Spinbox(self.font_frame, textvariable=self.font_size_var, 
+                                     values=common_sizes, width=8)
+        self.size_spin.grid(row=1, column=1, sticky=tk.W, padx=(5, 0), pady=2)
         
         # Change font checkbox
-        self.change_font_var = tk.BooleanVar()
         self.change_font_check = ttk.Checkbutton(self.font_frame, 
                                                  text="Override song font with selected font", 
                                                  variable=self.change_font_var)
@@ -359,17 +428,26 @@ class ExportOptionsDialog:
         self.text_opts_frame = ttk.LabelFrame(frame, text="Text Processing", padding="10")
         self.text_opts_frame.pack(fill=tk.X)
         
-        self.auto_break_lines_var = tk.BooleanVar()
         self.auto_break_check = ttk.Checkbutton(self.text_opts_frame, 
                                                text="Automatically break long lines", 
                                                variable=self.auto_break_lines_var)
-        self.auto_break_check.pack(anchor=tk.W, pady=2)
+        self.auto_break_check.grid(row=0, column=0, sticky=tk.W, pady=2)
         
-        ttk.Label(self.text_opts_frame, text="Maximum lines per slide:").pack(anchor=tk.W, pady=(5, 2))
-        self.max_lines_var = tk.IntVar()
+        ttk.Label(self.text_opts_frame, text="Maximum lines per slide:").grid(row=1, column=0, sticky=tk.W,
+                                                                           pady=(5, 2))
         self.max_lines_spin = ttk.Spinbox(self.text_opts_frame, from_=1, to=10, 
                                          textvariable=self.max_lines_var, width=10)
-        self.max_lines_spin.pack(anchor=tk.W)
+        self.max_lines_spin.grid(row=2, column=0, sticky=tk.W)
+        
+        # Widgets enabled/disabled by the master formatting control
+        self._formatting_widgets = (
+            self.font_combo,
+            self.size_spin,
+            self.change_font_check,
+            self.auto_break_check,
+            self.max_lines_spin
+        )
+        self._toggle_formatting_options()
     
     def _build_slides_tab(self, parent):
         """Build the slides options tab"""
@@ -380,80 +458,64 @@ class ExportOptionsDialog:
         intro_frame = ttk.LabelFrame(frame, text="First Slide", padding="10")
         intro_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.add_intro_var = tk.BooleanVar()
         intro_check = ttk.Checkbutton(intro_frame, text="Add intro slide as first slide", 
                                      variable=self.add_intro_var, 
                                      command=self._toggle_intro_options)
-        intro_check.pack(anchor=tk.W, pady=2)
+        intro_check.grid(row=0, column=0, sticky=tk.W, pady=2)
         
-        ttk.Label(intro_frame, text="Intro slide text:").pack(anchor=tk.W, pady=(5, 2))
-        self.intro_text_var = tk.StringVar()
+        ttk.Label(intro_frame, text="Intro slide text:").grid(row=1, column=0, sticky=tk.W, pady=(5, 2))
         self.intro_text_entry = ttk.Entry(intro_frame, textvariable=self.intro_text_var, 
                                          width=40, state='disabled')
-        self.intro_text_entry.pack(anchor=tk.W)
+        self.intro_text_entry.grid(row=2, column=0, sticky=tk.W)
         
-        ttk.Label(intro_frame, text="Group name:").pack(anchor=tk.W, pady=(5, 2))
-        self.intro_group_var = tk.StringVar()
+        ttk.Label(intro_frame, text="Group name:").grid(row=3, column=0, sticky=tk.W, pady=(5, 2))
         self.intro_group_entry = ttk.Entry(intro_frame, textvariable=self.intro_group_var, 
                                           width=20, state='disabled')
-        self.intro_group_entry.pack(anchor=tk.W)
+        self.intro_group_entry.grid(row=4, column=0, sticky=tk.W)
         
         # Blank slide
         blank_frame = ttk.LabelFrame(frame, text="Last Slide", padding="10")
         blank_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.add_blank_var = tk.BooleanVar()
         blank_check = ttk.Checkbutton(blank_frame, text="Add blank slide as last slide", 
                                      variable=self.add_blank_var, 
                                      command=self._toggle_blank_options)
-        blank_check.pack(anchor=tk.W, pady=2)
+        blank_check.grid(row=0, column=0, sticky=tk.W, pady=2)
         
-        ttk.Label(blank_frame, text="Group name:").pack(anchor=tk.W, pady=(5, 2))
-        self.blank_group_var = tk.StringVar()
+        ttk.Label(blank_frame, text="Group name:").grid(row=1, column=0, sticky=tk.W, pady=(5, 2))
         self.blank_group_entry = ttk.Entry(blank_frame, textvariable=self.blank_group_var, 
                                           width=20, state='disabled')
-        self.blank_group_entry.pack(anchor=tk.W)
+        self.blank_group_entry.grid(row=2, column=0, sticky=tk.W)
+        
+        # Widgets enabled/disabled by the intro and blank slide checkboxes
+        self._intro_widgets = (self.intro_text_entry, self.intro_group_entry)
+        self._blank_widgets = (self.blank_group_entry,)
+        self._toggle_intro_options()
+        self._toggle_blank_options()
     
     def _get_available_fonts(self):
         """Get list of available fonts on Windows"""
-        try:
-            import tkinter.font as tkfont
-            # Get all font families available in the system
-            fonts = list(tkfont.families())
-            # Filter out fonts that start with @ (vertical fonts in Windows)
-            fonts = [f for f in fonts if not f.startswith('@')]
-            # Sort alphabetically
-            fonts.sort()
-            return fonts
-        except Exception:
-            # Fallback to common fonts if can't get system fonts
-            return ['Arial', 'Helvetica', 'Times New Roman', 'Calibri', 
-                   'Verdana', 'Tahoma', 'Georgia', 'Impact', 'Comic Sans MS']
+        return _AVAILABLE_FONTS or _load_available_fonts()
     
     def _toggle_formatting_options(self):
         """Enable/disable formatting options based on master control"""
         state = 'normal' if self.formatting_enabled_var.get() else 'disabled'
         
-        # Toggle font frame widgets
-        for child in self.font_frame.winfo_children():
-            if isinstance(child, (ttk.Entry, ttk.Combobox, ttk.Checkbutton)):
-                child.config(state=state)
-        
-        # Toggle text options frame widgets
-        for child in self.text_opts_frame.winfo_children():
-            if isinstance(child, (ttk.Entry, ttk.Spinbox, ttk.Checkbutton, ttk.Combobox)):
-                child.config(state=state)
+        # Toggle font and text options widgets
+        for widget in self._formatting_widgets:
+            widget.config(state=state)
     
     def _toggle_intro_options(self):
         """Enable/disable intro slide options"""
         state = 'normal' if self.add_intro_var.get() else 'disabled'
-        self.intro_text_entry.config(state=state)
-        self.intro_group_entry.config(state=state)
+        for widget in self._intro_widgets:
+            widget.config(state=state)
     
     def _toggle_blank_options(self):
         """Enable/disable blank slide options"""
         state = 'normal' if self.add_blank_var.get() else 'disabled'
-        self.blank_group_entry.config(state=state)
+        for widget in self._blank_widgets:
+            widget.config(state=state)
     
     def _browse_output_dir(self):
         """Browse for output directory"""
@@ -467,104 +529,90 @@ class ExportOptionsDialog:
         if directory:
             self.output_dir_var.set(directory)
     
-    def _load_settings(self):
-        """Load current settings from config"""
-        # General
-        output_dir = self.config.get('export.output_directory')
-        if output_dir:
-            self.output_dir_var.set(output_dir)
-        
-        self.include_ccli_var.set(self.config.get('export.include_ccli_in_filename', False))
-        self.include_author_var.set(self.config.get('export.include_author_in_filename', False))
-        self.duplicate_action_var.set(self.config.get('export.duplicate_handling_action', 'ask'))
+    def _collect_values(self) -> Dict[str, Any]:
+        """Collect the current setting values keyed by config key"""
+        # Convert font size string to int for config, clamped to the 12-200 range
+        try:
+            font_size = min(max(int(self.font_size_var.get()), 12), 200)
+        except ValueError:
+            font_size = 72  # Default if invalid
         
-        # Formatting
-        self.formatting_enabled_var.set(self.config.get('export.formatting_enabled', False))
-        self.font_family_var.set(self.config.get('export.font.family', 'Arial'))
-        self.font_size_var.set(str(self.config.get('export.font.size', 72)))
-        self.change_font_var.set(self.config.get('export.change_font', False))
-        self.auto_break_lines_var.set(self.config.get('export.slides.auto_break_long_lines', True))
+        values = {
+            # General
+            'export.include_ccli_in_filename': self.include_ccli_var.get(),
+            'export.include_author_in_filename': self.include_author_var.get(),
+            'export.duplicate_handling_action': self.duplicate_action_var.get(),
+            
+            # Formatting
+            'export.formatting_enabled': self.formatting_enabled_var.get(),
+            'export.font.family': self.font_family_var.get(),
+            'export.font.size': font_size,
+            'export.change_font': self.change_font_var.get(),
+            'export.slides.auto_break_long_lines': self.auto_break_lines_var.get(),
+            
+            # Slides
+            'export.slides.add_intro_slide': self.add_intro_var.get(),
+            'export.slides.intro_slide_text': self.intro_text_var.get(),
+            'export.slides.intro_slide_group': self.intro_group_var.get(),
+            'export.slides.add_blank_slide': self.add_blank_var.get(),
+            'export.slides.blank_slide_group': self.blank_group_var.get(),
+            'export.slides.max_lines_per_slide': self.max_lines_var.get()
+        }
         
-        # Slides
-        self.add_intro_var.set(self.config.get('export.slides.add_intro_slide', False))
-        self.intro_text_var.set(self.config.get('export.slides.intro_slide_text', ''))
-        self.intro_group_var.set(self.config.get('export.slides.intro_slide_group', 'Intro'))
-        self.add_blank_var.set(self.config.get('export.slides.add_blank_slide', False))
-        self.blank_group_var.set(self.config.get('export.slides.blank_slide_group', 'Blank'))
-        self.max_lines_var.set(self.config.get('export.slides.max_lines_per_slide', 4))
-        
-        # Update UI states
-        self._toggle_formatting_options()
-        self._toggle_intro_options()
-        self._toggle_blank_options()
-    
-    def _save_settings(self):
-        """Save settings to config"""
-        # General
         output_dir = self.output_dir_var.get()
         if output_dir:
-            self.config.set('export.output_directory', output_dir, save=False)
-        
-        self.config.set('export.include_ccli_in_filename', self.include_ccli_var.get(), save=False)
-        self.config.set('export.include_author_in_filename', self.include_author_var.get(), save=False)
-        self.config.set('export.duplicate_handling_action', self.duplicate_action_var.get(), save=False)
+            values['export.output_directory'] = output_dir
         
-        # Formatting
-        self.config.set('export.formatting_enabled', self.formatting_enabled_var.get(), save=False)
-        self.config.set('export.font.family', self.font_family_var.get(), save=False)
-        # Convert font size string to int for config
+        return values
+    
+    def _has_changes(self) -> bool:
+        """Check whether any setting differs from the last loaded or saved values"""
         try:
-            font_size = int(self.font_size_var.get())
-        except ValueError:
-            font_size = 72  # Default if invalid
-        self.config.set('export.font.size', font_size, save=False)
-        self.config.set('export.change_font', self.change_font_var.get(), save=False)
-        self.config.set('export.slides.auto_break_long_lines', self.auto_break_lines_var.get(), save=False)
-        
-        # Slides
-        self.config.set('export.slides.add_intro_slide', self.add_intro_var.get(), save=False)
-        self.config.set('export.slides.intro_slide_text', self.intro_text_var.get(), save=False)
-        self.config.set('export.slides.intro_slide_group', self.intro_group_var.get(), save=False)
-        self.config.set('export.slides.add_blank_slide', self.add_blank_var.get(), save=False)
-        self.config.set('export.slides.blank_slide_group', self.blank_group_var.get(), save=False)
-        self.config.set('export.slides.max_lines_per_slide', self.max_lines_var.get(), save=False)
-        
-        # Save all settings
-        self.config.save_settings()
+            return self._collect_values() != self._saved_values
+        except tk.TclError:
+            # Unparseable entry (e.g. max lines), treat as a change
+            return True
     
-    def _save_clicked(self):
-        """Handle Save button click - save and close"""
-        self._save_settings()
-        self.result = 'saved'
-        messagebox.showinfo("Settings Saved", "Export settings have been saved successfully.", 
-                          parent=self.dialog)
-        self.dialog.destroy()
+    def _save_settings(self):
+        """Save settings to config"""
+        values = self._collect_values()
+        self.font_size_var.set(str(values['export.font.size']))
+        
+        # Update and save all settings at once
+        self.config.update(values)
+        self._saved_values = values
     
-    def _apply_clicked(self):
-        """Handle Apply button click - save without closing"""
-        self._save_settings()
-        messagebox.showinfo("Settings Applied", "Export settings have been applied.", 
-                          parent=self.dialog)
+    def _finish(self, result: Optional[str], save: bool = False,
+                notify: Optional[Tuple[str, str]] = None):
+        """Optionally save and show a message, then close with result
+        
+        A result of None keeps the dialog open.
+        """
+        if save:
+            self._save_settings()
+        if notify:
+            messagebox.showinfo(*notify, parent=self.dialog)
+        if result is not None:
+            self.result = result
+            self.dialog.destroy()
     
     def _cancel_clicked(self):
         """Handle Cancel button click - close without saving"""
-        response = messagebox.askyesno("Confirm Cancel", 
-                                      "Are you sure you want to cancel?\nAny unsaved changes will be lost.", 
-                                      parent=self.dialog)
-        if response:
-            self.result = 'cancelled'
-            self.dialog.destroy()
+        if self._has_changes() and not messagebox.askyesno(
+                "Confirm Cancel", 
+                "Are you sure you want to cancel?\nAny unsaved changes will be lost.", 
+                parent=self.dialog):
+            return
+        self._finish('cancelled')
     
     def _on_closing(self):
         """Handle window close button"""
+        if not self._has_changes():
+            self._finish('cancelled')
+            return
+        
         response = messagebox.askyesnocancel("Save Changes", 
                                             "Do you want to save your changes before closing?", 
                                             parent=self.dialog)
-        if response is True:  # Yes - save and close
-            self._save_settings()
-            self.result = 'saved'
-            self.dialog.destroy()
-        elif response is False:  # No - close without saving
-            self.result = 'cancelled'
-            self.dialog.destroy()
-        # If None (Cancel), do nothing - keep dialog open
\ No newline at end of file
+        # Yes saves and closes, No closes without saving, Cancel keeps the dialog open
+        self._finish(*self._CLOSING_ACTIONS[response])
@@ -8,10 +8,12 @@ from pathlib import Path
 import os
 import re
 import threading
+import queue
 import json
 import logging
 from typing import List, Optional, Dict, Any
 from collections import deque
+from itertools import islice
 from src.database.easyworship import EasyWorshipDatabase
 from src.export.propresenter import ProPresenter6Exporter
 from src.gui.settings_window import SettingsWindow
@@ -22,6 +24,58 @@ from src.version import __version__, RELEASE_DATE, RELEASE_YEAR
 
 logger = logging.getLogger(__name__)
 
+# Size in pixels of the check box images in the song list
+_CHECK_IMAGE_SIZE = 13
+
+# Interval for checking results from database worker threads
+_WORKER_POLL_MS = 50
+
+# Minimum interval between export progress refreshes
+_PROGRESS_INTERVAL_MS = 50
+
+# Delay after the last change of the search text before the list is filtered
+_SEARCH_DELAY_MS = 150
+
+# Number of song rows inserted into the tree per idle callback
+_DISPLAY_CHUNK_SIZE = 500
+
+# Common EasyWorship installation paths, probed in this order
+_DEFAULT_DB_CANDIDATES = (
+    Path(os.environ.get('PROGRAMDATA', 'C:\\ProgramData')) / 'Softouch' / 'Easyworship' / 'Default' / 'Databases' / 'Data',
+    Path(os.environ.get('USERPROFILE', '')) / 'Documents' / 'EasyWorship' / 'Default' / 'Databases' / 'Data',
+    Path('C:\\Users\\Public\\Documents\\Softouch\\Easyworship\\Default\\Databases\\Data'),
+)
+
+# Export directory used when none has been saved
+_DEFAULT_OUTPUT_PATH = str(Path.home() / "Desktop" / "ProPresenter_Export")
+
+# File keeping the last searches between sessions
+_SEARCH_HISTORY_FILE = Path.home() / '.ewexport' / 'search_history.json'
+
+# Delay before a changed search history is written to disk
+_HISTORY_SAVE_DELAY_MS = 500
+
+
+def _create_check_images(master) -> tuple:
+    """Draw the unchecked and checked box images shown in the song list
+    
+    Images look the same with any font, and unlike item text they do not have
+    to be measured again by the Treeview when a row changes state.
+    """
+    size = _CHECK_IMAGE_SIZE
+    unchecked = tk.PhotoImage(master=master, width=size, height=size)
+    unchecked.put('#ffffff', to=(1, 1, size - 1, size - 1))
+    for box in ((0, 0, size, 1), (0, size - 1, size, size), (0, 0, 1, size), (size - 1, 0, size, size)):
+        unchecked.put('#5c5c5c', to=box)
+    
+    checked = unchecked.copy()
+    # Tick mark drawn as 2x2 pixel steps: a short stroke down, a long one up
+    for x, y in ((3, 5), (4, 6), (5, 7), (6, 6), (7, 5), (8, 4), (9, 3)):
+        checked.put('#1a5fb4', to=(x, y, x + 2, y + 2))
+    
+    return (unchecked, checked)
+
+
 class MainWindow:
     def __init__(self):
         self.root = tk.Tk()
@@ -36,15 +90,36 @@ class MainWindow:
         self.db_path = tk.StringVar()
         self.output_path = tk.StringVar()
         self.search_var = tk.StringVar()
+        # Label texts are set through variables instead of configuring the labels
+        self.status_text = tk.StringVar(value="No database loaded")
+        self.selected_count_text = tk.StringVar(value="0 songs selected")
+        self.progress_text = tk.StringVar(value="Ready to export")
         self.selected_songs = set()
+        self.item_song_ids = {}  # Tree item id -> song rowid, including hidden rows
+        self.song_items = {}  # Song rowid -> tree item id
+        self._pending_songs = iter(())  # Songs not yet inserted into the tree
+        self._shown_song_ids = None  # Rowids shown by the search, None for all songs
+        self._display_job = None  # Idle callback inserting the next chunk
+        self._count_update_scheduled = False  # Selected count label refresh pending
         self.songs_data = []
         self.filtered_songs = []  # Songs currently shown after filtering
+        self._filter_text = ''  # Search text filtered_songs was built for
+        self._search_job = None  # Pending filter callback while typing
         self.all_songs = []  # All songs from database
+        self.song_index = {}  # Song rowid -> position in all_songs
+        self.display_values = {}  # Song rowid -> tree column values
+        self.search_texts = {}  # Song rowid -> lowercased searchable fields
         self.search_history = deque(maxlen=10)  # Last 10 searches
+        self._history_save_job = None  # Pending background save of the search history
+        self._history_lock = threading.Lock()  # Serializes search history file writes
         self.db = None
+        self.loading_songs = False
+        self._worker_results = queue.Queue()  # Results from database worker threads
         self.exporter = ProPresenter6Exporter(config=self.config)
         self.export_in_progress = False
         self.export_cancel_event = threading.Event()  # For proper thread cancellation
+        self._progress_state = None  # Latest (current, total, title) from the export thread
+        self._progress_pending = False  # Progress refresh scheduled
         self.duplicate_action = None  # For remembering duplicate handling choice
         self.update_checker = UpdateChecker(config=self.config)
         
@@ -54,9 +129,6 @@ class MainWindow:
         self.setup_ui()
         self.auto_load_database()
         
-        # Bind search variable to update function
-        self.search_var.trace('w', self.on_search_changed)
-        
         # Save geometry on close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
@@ -89,11 +161,11 @@ class MainWindow:
         browse_btn = ttk.Button(db_frame, text="Browse...", command=self.browse_database)
         browse_btn.grid(row=0, column=2, padx=(5, 0))
         
-        load_btn = ttk.Button(db_frame, text="Load Songs", command=self.load_songs)
-        load_btn.grid(row=0, column=3, padx=(5, 0))
+        self.load_btn = ttk.Button(db_frame, text="Load Songs", command=self.load_songs)
+        self.load_btn.grid(row=0, column=3, padx=(5, 0))
         
         # Song count label
-        self.status_label = ttk.Label(db_frame, text="No database loaded")
+        self.status_label = ttk.Label(db_frame, textvariable=self.status_text)
         self.status_label.grid(row=1, column=0, columnspan=4, sticky=tk.W, pady=(5, 0))
         
         # Song list frame
@@ -113,6 +185,10 @@ class MainWindow:
         self.search_combo = ttk.Combobox(search_frame, textvariable=self.search_var, width=30)
         self.search_combo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
         self.search_combo.bind('<Return>', self.add_to_search_history)
+        # Filter on typing and on picking a previous search; programmatic
+        # changes of search_var apply the filter themselves
+        self.search_combo.bind('<KeyRelease>', self.on_search_changed)
+        self.search_combo.bind('<<ComboboxSelected>>', self.on_search_changed)
         
         # Clear search button
         ttk.Button(search_frame, text="Clear", command=self.clear_search).pack(side=tk.LEFT, padx=(0, 10))
@@ -128,7 +204,7 @@ class MainWindow:
         ttk.Button(button_frame, text="Select All", command=self.select_all).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="Select None", command=self.select_none).pack(side=tk.LEFT, padx=(0, 5))
         
-        self.selected_count_label = ttk.Label(button_frame, text="0 songs selected")
+        self.selected_count_label = ttk.Label(button_frame, textvariable=self.selected_count_text)
         self.selected_count_label.pack(side=tk.LEFT, padx=(20, 0))
         
         # PanedWindow to split song list and preview
@@ -149,17 +225,20 @@ class MainWindow:
         self.tree.heading('#0', text='✓', anchor=tk.W)
         self.tree.column('#0', width=30, stretch=False)
 
-        self.tree.heading('title', text='Title')
-        self.tree.column('title', width=300)
-
-        self.tree.heading('author', text='Author')
-        self.tree.column('author', width=200)
-
-        self.tree.heading('copyright', text='Copyright')
-        self.tree.column('copyright', width=200)
-
-        self.tree.heading('ccli', text='CCLI/Ref')
-        self.tree.column('ccli', width=100)
+        # Check box images shown through the 'unchecked'/'checked' item tags,
+        # so many rows can change state with one tag add/remove call
+        self.check_images = _create_check_images(self.root)
+        self.tree.tag_configure('unchecked', image=self.check_images[False])
+        self.tree.tag_configure('checked', image=self.check_images[True])
+
+        # Columns start at the widths saved on the last close
+        widths = self.config.get_column_widths()
+        for column, heading, default_width in (('title', 'Title', 300),
+                                               ('author', 'Author', 200),
+                                               ('copyright', 'Copyright', 200),
+                                               ('ccli', 'CCLI/Ref', 100)):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=widths.get(column, default_width))
 
         # Add scrollbars
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
@@ -209,7 +288,7 @@ class MainWindow:
         self.progress.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
         
         # Progress label
-        self.progress_label = ttk.Label(progress_frame, text="Ready to export")
+        self.progress_label = ttk.Label(progress_frame, textvariable=self.progress_text)
         self.progress_label.grid(row=1, column=0, sticky=tk.W)
         
         # Export button
@@ -294,20 +373,32 @@ GitHub: https://github.com/karllinder/ewexport"""
         messagebox.showinfo("About", about_text)
     
     def auto_load_database(self):
-        """Auto-load database from saved path or auto-detection"""
-        # First try to load from saved path
-        last_db = self.config.get('paths.last_easyworship_path')
-        if last_db and Path(last_db).exists() and (Path(last_db) / 'Songs.db').exists():
-            self.db_path.set(last_db)
-            self.load_songs()
-            # Load export path settings
-            self.load_export_path_settings()
-            return
+        """Auto-load database from saved path or auto-detection
         
-        # If no saved path, try auto-detection
-        self.auto_detect_easyworship()
+        The database locations are probed in a background thread since
+        network drives can make the existence checks slow.
+        """
         # Load export path settings
         self.load_export_path_settings()
+        
+        threading.Thread(target=self._find_database_worker, daemon=True).start()
+        self.root.after(_WORKER_POLL_MS, self._poll_worker_results)
+    
+    def _find_database_worker(self):
+        """Background worker looking for the database to load on startup"""
+        try:
+            # First try the saved path
+            last_db = self.config.get('paths.last_easyworship_path')
+            if last_db and os.path.isfile(os.path.join(last_db, 'Songs.db')):
+                found = last_db
+            else:
+                # If no saved path, try auto-detection
+                found = self.auto_detect_easyworship()
+        except OSError as e:
+            logger.warning(f"Database auto-detection failed: {e}")
+            found = None
+        
+        self._worker_results.put(('database_found', found))
     
     def load_export_path_settings(self):
         """Load export path settings only"""
@@ -317,20 +408,13 @@ GitHub: https://github.com/karllinder/ewexport"""
         else:
             self.set_default_output_path()
     
-    def auto_detect_easyworship(self):
-        """Try to auto-detect EasyWorship database path"""
-        # Common EasyWorship installation paths
-        possible_paths = [
-            Path(os.environ.get('PROGRAMDATA', 'C:\\ProgramData')) / 'Softouch' / 'Easyworship' / 'Default' / 'Databases' / 'Data',
-            Path(os.environ.get('USERPROFILE', '')) / 'Documents' / 'EasyWorship' / 'Default' / 'Databases' / 'Data',
-            Path('C:\\Users\\Public\\Documents\\Softouch\\Easyworship\\Default\\Databases\\Data'),
-        ]
-        
-        for path in possible_paths:
-            if path.exists() and (path / 'Songs.db').exists():
-                self.db_path.set(str(path))
-                self.load_songs()
-                break
+    def auto_detect_easyworship(self) -> Optional[str]:
+        """Try to auto-detect EasyWorship database path, return it if found"""
+        # A single stat per candidate: Songs.db can only be a file if its folder exists
+        for path in _DEFAULT_DB_CANDIDATES:
+            if (path / 'Songs.db').is_file():
+                return str(path)
+        return None
     
     def browse_database(self):
         """Browse for EasyWorship database folder - enhanced to show .db files"""
@@ -376,102 +460,199 @@ GitHub: https://github.com/karllinder/ewexport"""
             self.load_songs()
     
     def load_songs(self):
-        """Load songs from the selected database"""
+        """Load songs from the selected database in a background thread"""
         db_path = self.db_path.get()
         if not db_path:
             messagebox.showwarning("No Path", "Please select a database folder first.")
             return
         
+        if self.loading_songs:
+            return
+        
+        self.loading_songs = True
+        self.load_btn.config(state='disabled')
+        self.status_text.set("Loading songs...")
+        
+        threading.Thread(target=self._load_songs_worker, args=(db_path,), daemon=True).start()
+        self.root.after(_WORKER_POLL_MS, self._poll_worker_results)
+    
+    def _load_songs_worker(self, db_path: str):
+        """Background worker reading the song list from the database"""
         try:
-            self.db = EasyWorshipDatabase(db_path)
+            db = EasyWorshipDatabase(db_path)
             
-            if not self.db.validate_database():
-                messagebox.showerror("Invalid Database", 
-                                   "The selected folder does not contain valid EasyWorship database files.")
+            if not db.validate_database():
+                self._worker_results.put(('load_failed', "Invalid Database",
+                                          "The selected folder does not contain valid EasyWorship database files."))
                 return
             
-            # Clear existing items
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-            self.selected_songs.clear()
-            self._clear_preview()
-            
-            # Load songs
-            self.all_songs = self.db.get_all_songs()
-            self.songs_data = self.all_songs.copy()
-            self.filtered_songs = self.all_songs.copy()
-            song_count = len(self.all_songs)
-            
-            # Apply current search filter if any
-            if self.search_var.get():
-                self.apply_search_filter()
-            else:
-                self.display_songs(self.filtered_songs)
-            
-            self.status_label.config(text=f"Loaded {song_count} songs from database")
-            self.export_btn.config(state='normal' if song_count > 0 else 'disabled')
-            self.update_selected_count()
-            self.update_result_count()
+            songs = db.get_all_songs()
+            self._worker_results.put(('songs_loaded', db, songs))
             
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load database: {str(e)}")
+            self._worker_results.put(('load_failed', "Error", f"Failed to load database: {str(e)}"))
+    
+    def _poll_worker_results(self):
+        """Handle a result posted by a database worker thread
+        
+        Workers hand results back through a queue polled from the main loop,
+        since Tk calls from other threads fail before mainloop() is running
+        (e.g. while the first run dialogs are shown).
+        """
+        try:
+            kind, *args = self._worker_results.get_nowait()
+        except queue.Empty:
+            self.root.after(_WORKER_POLL_MS, self._poll_worker_results)
+            return
+        
+        if kind == 'songs_loaded':
+            self._songs_loaded(*args)
+        elif kind == 'load_failed':
+            self._songs_load_failed(*args)
+        elif kind == 'database_found':
+            self._database_found(*args)
+    
+    def _database_found(self, path: Optional[str]):
+        """Load the database found on startup unless one was chosen meanwhile"""
+        if path and not self.db and not self.loading_songs:
+            self.db_path.set(path)
+            self.load_songs()
+    
+    def _songs_loaded(self, db: EasyWorshipDatabase, songs: List[Dict[str, Any]]):
+        """Show songs loaded by the background worker"""
+        self.loading_songs = False
+        self.load_btn.config(state='normal')
+        self.db = db
+        
+        # Existing items are cleared when the songs are displayed
+        self.selected_songs.clear()
+        self._clear_preview()
+        
+        self.all_songs = songs
+        self.song_index = {song['rowid']: i for i, song in enumerate(songs)}
+        # Tree values are built once per load instead of on every redisplay
+        self.display_values = {
+            song['rowid']: (song['title'],
+                            song['author'] or '-',
+                            song['copyright'] or '-',
+                            song['reference_number'] or '-')
+            for song in songs
+        }
+        # Searched fields are lowercased once, one line per field so a search
+        # cannot match across two fields
+        self.search_texts = {
+            song['rowid']: '\n'.join((song['title'] or '',
+                                      song['author'] or '',
+                                      song['copyright'] or '',
+                                      song['reference_number'] or '')).lower()
+            for song in songs
+        }
+        self.songs_data = self.all_songs.copy()
+        self.filtered_songs = self.all_songs.copy()
+        self._filter_text = ''
+        song_count = len(self.all_songs)
+        
+        # Rows are created once per load, the search filter only hides them
+        self.populate_tree(self.all_songs)
+        
+        # Apply current search filter if any
+        if self.search_var.get():
+            self.apply_search_filter()
+        
+        self.status_text.set(f"Loaded {song_count} songs from database")
+        self.export_btn.config(state='normal' if song_count > 0 else 'disabled')
+        self.update_selected_count()
+        self.update_result_count()
+    
+    def _songs_load_failed(self, title: str, message: str):
+        """Report a failed song load and keep the previously loaded songs"""
+        self.loading_songs = False
+        self.load_btn.config(state='normal')
+        if self.db:
+            self.status_text.set(f"Loaded {len(self.all_songs)} songs from database")
+        else:
+            self.status_text.set("No database loaded")
+        
+        messagebox.showerror(title, message)
     
     def on_item_click(self, event):
         """Handle click on tree item to toggle selection and update preview"""
-        region = self.tree.identify_region(event.x, event.y)
+        # Clicks below the last row, on headings or separators hit no item
         item = self.tree.identify_row(event.y)
+        if not item:
+            return
 
+        region = self.tree.identify_region(event.x, event.y)
         if region == "tree":
-            if item:
-                self.toggle_item_selection(item)
-                self._update_preview_for_item(item)
-        elif region in ("cell", "heading") and item:
+            self.toggle_item_selection(item)
+            self._update_preview_for_item(item)
+        elif region == "cell":
             self._update_preview_for_item(item)
     
     def toggle_item_selection(self, item):
         """Toggle selection state of an item"""
-        tags = self.tree.item(item, 'tags')
-        if tags and len(tags) > 0:
-            song_id = int(tags[0])  # Ensure it's an integer
-            
+        song_id = self.item_song_ids.get(item)
+        if song_id is not None:
             if song_id in self.selected_songs:
                 self.selected_songs.remove(song_id)
-                self.tree.item(item, text='☐')
+                self.tree.item(item, tags=(song_id, 'unchecked'))
             else:
                 self.selected_songs.add(song_id)
-                self.tree.item(item, text='☑')
+                self.tree.item(item, tags=(song_id, 'checked'))
         
-        self.update_selected_count()
+        self._schedule_count_update()
     
     def select_all(self):
         """Select all songs"""
-        for item in self.tree.get_children():
-            tags = self.tree.item(item, 'tags')
-            if tags and len(tags) > 0:
-                song_id = int(tags[0])  # Ensure it's an integer
-                self.selected_songs.add(song_id)
-                self.tree.item(item, text='☑')
+        self._finish_song_display()
+        
+        # Only rows shown by the current search are selected, and only rows
+        # that change state are updated in the tree
+        item_song_ids = self.item_song_ids
+        shown = [(item, item_song_ids[item]) for item in self.tree.get_children()]
+        selected = self.selected_songs
+        changed = [item for item, song_id in shown if song_id not in selected]
+        selected.update(song_id for item, song_id in shown)
+        self._set_check_tag(changed, 'checked', 'unchecked')
         
         self.update_selected_count()
     
     def select_none(self):
         """Deselect all songs"""
-        self.selected_songs.clear()
-        for item in self.tree.get_children():
-            self.tree.item(item, text='☐')
+        self._finish_song_display()
+        
+        # Only rows that change state are updated in the tree
+        selected = self.selected_songs
+        changed = [item for item, song_id in self.item_song_ids.items() if song_id in selected]
+        selected.clear()
+        self._set_check_tag(changed, 'unchecked', 'checked')
         
         self.update_selected_count()
     
+    def _set_check_tag(self, items: List[str], add: str, remove: str):
+        """Switch the check state tag of many tree items in two Tcl calls"""
+        if items:
+            self.tree.tk.call(self.tree, 'tag', 'remove', remove, items)
+            self.tree.tk.call(self.tree, 'tag', 'add', add, items)
+    
     def update_selected_count(self):
         """Update the selected songs count label"""
+        self._count_update_scheduled = False
         count = len(self.selected_songs)
-        self.selected_count_label.config(text=f"{count} song{'s' if count != 1 else ''} selected")
+        self.selected_count_text.set(f"{count} song{'s' if count != 1 else ''} selected")
+    
+    def _schedule_count_update(self):
+        """Update the selected count once the pending events have been handled
+        
+        Several toggles within one event cycle result in a single label update.
+        """
+        if not self._count_update_scheduled:
+            self._count_update_scheduled = True
+            self.root.after_idle(self.update_selected_count)
     
     def set_default_output_path(self):
         """Set default output path"""
-        desktop = Path.home() / "Desktop"
-        default_path = desktop / "ProPresenter_Export"
-        self.output_path.set(str(default_path))
+        self.output_path.set(_DEFAULT_OUTPUT_PATH)
     
     def browse_output_path(self):
         """Browse for output directory"""
@@ -507,7 +688,7 @@ GitHub: https://github.com/karllinder/ewexport"""
         self.export_btn.config(state='disabled')
         self.cancel_btn.config(state='normal')
         self.progress.config(mode='determinate', value=0)
-        self.progress_label.config(text="Preparing export...")
+        self.progress_text.set("Preparing export...")
 
         self.export_thread = threading.Thread(target=self.export_worker, daemon=True)
         self.export_thread.start()
@@ -517,29 +698,41 @@ GitHub: https://github.com/karllinder/ewexport"""
         try:
             # Collect selected songs with processed lyrics
             songs_to_export = []
-            selected_song_ids = list(self.selected_songs)
+            # Look the selected songs up by position in all_songs, which keeps
+            # the list order without scanning unselected songs (all_songs is
+            # used instead of songs_data to export all selected songs)
+            all_songs = self.all_songs
+            song_index = self.song_index
+            positions = sorted(song_index[song_id] for song_id in list(self.selected_songs)
+                               if song_id in song_index)
             
-            # Use all_songs instead of songs_data to ensure we export all selected songs
-            for song_data in self.all_songs:
-                if song_data['rowid'] in selected_song_ids:
-                    # Get processed lyrics with sections
-                    processed = self.db.get_song_with_processed_lyrics(song_data['rowid'])
-                    
-                    if processed:
-                        # Use the processed song data which has all fields properly filled
-                        # This ensures we have consistent data for export
-                        if processed.get('sections'):
-                            sections = processed['sections']
-                            songs_to_export.append((processed, sections))
-                        else:
-                            # Songs without any parseable content - add with empty section
-                            # This will be caught by the exporter's validation
-                            empty_sections = []
-                            songs_to_export.append((processed, empty_sections))
+            cancel_event = self.export_cancel_event
+            for position in positions:
+                # Processing lyrics can take a while, stop as soon as cancel is pressed
+                if cancel_event.is_set():
+                    logger.info("Export cancelled by user while preparing songs")
+                    self.root.after(0, self.export_complete, [], [], [])
+                    return
+                
+                song_data = all_songs[position]
+                # Get processed lyrics with sections
+                processed = self.db.get_song_with_processed_lyrics(song_data['rowid'])
+                
+                if processed:
+                    # Use the processed song data which has all fields properly filled
+                    # This ensures we have consistent data for export
+                    if processed.get('sections'):
+                        sections = processed['sections']
+                        songs_to_export.append((processed, sections))
                     else:
-                        # Fallback if processing fails - still try to export with basic data
-                        logger.warning(f"Could not process song ID {song_data['rowid']}: {song_data.get('title', 'Unknown')}")
-                        songs_to_export.append((song_data, []))
+                        # Songs without any parseable content - add with empty section
+                        # This will be caught by the exporter's validation
+                        empty_sections = []
+                        songs_to_export.append((processed, empty_sections))
+                else:
+                    # Fallback if processing fails - still try to export with basic data
+                    logger.warning(f"Could not process song ID {song_data['rowid']}: {song_data.get('title', 'Unknown')}")
+                    songs_to_export.append((song_data, []))
             
             # Export songs
             output_dir = Path(self.output_path.get())
@@ -560,24 +753,40 @@ GitHub: https://github.com/karllinder/ewexport"""
             self.root.after(0, self.export_error, error_msg)
     
     def update_export_progress(self, current: int, total: int, song_title: str):
-        """Update progress bar and label (called from background thread)"""
-        def update_ui():
-            if total > 0:
-                progress_percent = (current / total) * 100
-                self.progress.config(value=progress_percent)
-            
-            if current < total:
-                self.progress_label.config(text=f"Exporting: {song_title} ({current + 1}/{total})")
-            else:
-                self.progress_label.config(text="Export complete")
+        """Record export progress (called from background thread)
+        
+        Only the latest state is kept and the UI is refreshed at most once per
+        interval, however fast songs are exported.
+        """
+        self._progress_state = (current, total, song_title)
+        if not self._progress_pending:
+            self._progress_pending = True
+            self.root.after(_PROGRESS_INTERVAL_MS, self._flush_export_progress)
+    
+    def _flush_export_progress(self):
+        """Update progress bar and label with the latest recorded progress"""
+        self._progress_pending = False
+        state = self._progress_state
+        if state is None:
+            # Export already finished
+            return
+        
+        current, total, song_title = state
+        if total > 0:
+            progress_percent = (current / total) * 100
+            self.progress.config(value=progress_percent)
         
-        self.root.after(0, update_ui)
+        if current < total:
+            self.progress_text.set(f"Exporting: {song_title} ({current + 1}/{total})")
+        else:
+            self.progress_text.set("Export complete")
     
     def export_complete(self, successful: List[str], failed: List[str], skipped: List[str] = None):
         """Handle export completion"""
         if skipped is None:
             skipped = []
 
+        self._progress_state = None  # Drop any progress update still pending
         self.export_in_progress = False
         self.export_btn.config(state='normal')
         self.cancel_btn.config(state='disabled')
@@ -586,7 +795,7 @@ GitHub: https://github.com/karllinder/ewexport"""
         was_cancelled = self.export_cancel_event.is_set()
         if was_cancelled:
             self.progress.config(value=0)
-            self.progress_label.config(text="Export cancelled")
+            self.progress_text.set("Export cancelled")
             success_count = len(successful)
             skip_count = len(skipped)
             message = f"Export was cancelled.\n\n"
@@ -618,11 +827,11 @@ GitHub: https://github.com/karllinder/ewexport"""
             message += f"Exported: {success_count} song{'s' if success_count != 1 else ''}\n"
             message += f"Skipped: {skip_count} song{'s' if skip_count != 1 else ''}\n\n"
             if skipped:
-                message += "Skipped files:\n"
-                for title in skipped[:5]:
-                    message += f"  {title}\n"
-                if len(skipped) > 5:
-                    message += f"  ... and {len(skipped) - 5} more"
+                parts = ["Skipped files:\n"]
+                parts.extend(f"  {title}\n" for title in islice(skipped, 5))
+                if skip_count > 5:
+                    parts.append(f"  ... and {skip_count - 5} more")
+                message += ''.join(parts)
             message += f"\n\nFiles saved to: {self.output_path.get()}"
             messagebox.showinfo("Export Complete", message)
 
@@ -637,26 +846,27 @@ GitHub: https://github.com/karllinder/ewexport"""
             message += f"Failed: {fail_count} song{'s' if fail_count != 1 else ''}\n\n"
 
             if failed:
-                message += "Failed exports:\n"
-                for error in failed[:5]:  # Show first 5 errors
-                    message += f"  {error}\n"
-                if len(failed) > 5:
-                    message += f"  ... and {len(failed) - 5} more errors"
+                parts = ["Failed exports:\n"]
+                parts.extend(f"  {error}\n" for error in islice(failed, 5))  # Show first 5 errors
+                if fail_count > 5:
+                    parts.append(f"  ... and {fail_count - 5} more errors")
+                message += ''.join(parts)
 
             messagebox.showwarning("Export Completed with Errors", message)
 
             # Clear selection even if some exports failed
             self.select_none()
 
-        self.progress_label.config(text="Ready to export")
+        self.progress_text.set("Ready to export")
     
     def export_error(self, error_message: str):
         """Handle export error"""
+        self._progress_state = None  # Drop any progress update still pending
         self.export_in_progress = False
         self.export_btn.config(state='normal')
         self.cancel_btn.config(state='disabled')
         self.progress.config(value=0)
-        self.progress_label.config(text="Export failed")
+        self.progress_text.set("Export failed")
         
         messagebox.showerror("Export Error", error_message)
     
@@ -668,58 +878,137 @@ GitHub: https://github.com/karllinder/ewexport"""
             self.export_in_progress = False
             self.export_btn.config(state='normal')
             self.cancel_btn.config(state='disabled')
-            self.progress_label.config(text="Cancelling export...")
+            self.progress_text.set("Cancelling export...")
             # Note: The export thread will check the cancel event and stop gracefully
     
     def on_search_changed(self, *args):
-        """Handle search text changes for real-time filtering"""
-        self.apply_search_filter()
+        """Handle search text changes for real-time filtering
+        
+        Filtering waits until typing pauses, so a burst of keystrokes
+        filters the list once.
+        """
+        # Keys that leave the text unchanged, like arrows or Shift, need no filtering
+        if not self._search_job and self.search_var.get().lower().strip() == self._filter_text:
+            return
+        if self._search_job:
+            self.root.after_cancel(self._search_job)
+        self._search_job = self.root.after(_SEARCH_DELAY_MS, self.apply_search_filter)
     
     def apply_search_filter(self):
         """Apply search filter to song list"""
+        # A direct call makes a delayed filter from typing unnecessary
+        if self._search_job:
+            self.root.after_cancel(self._search_job)
+            self._search_job = None
+        
         search_text = self.search_var.get().lower().strip()
         
+        # Typing more characters can only narrow the result, so only the
+        # songs matching the previous search need to be checked again
+        if search_text.startswith(self._filter_text):
+            candidates = self.filtered_songs
+        else:
+            candidates = self.all_songs
+        self._filter_text = search_text
+        
         if not search_text:
             # No search, show all songs
             self.filtered_songs = self.all_songs.copy()
         else:
-            # Filter songs based on search text
-            self.filtered_songs = []
-            for song in self.all_songs:
-                # Search in title, author, copyright, and CCLI number
-                if (search_text in (song['title'] or '').lower() or
-                    search_text in (song['author'] or '').lower() or
-                    search_text in (song['copyright'] or '').lower() or
-                    search_text in (song['reference_number'] or '').lower()):
-                    self.filtered_songs.append(song)
+            # Filter songs based on search text in title, author, copyright, and CCLI number
+            search_texts = self.search_texts
+            self.filtered_songs = [song for song in candidates
+                                   if search_text in search_texts[song['rowid']]]
         
         # Update display
         self.display_songs(self.filtered_songs)
         self.update_result_count()
     
+    def populate_tree(self, songs: List[Dict[str, Any]]):
+        """Replace the rows of the tree view with the given list of songs
+        
+        The first chunk of rows is inserted right away and the rest in idle
+        callbacks, so the window stays responsive for large song lists.
+        """
+        # Drop rows still pending from a previous call
+        if self._display_job:
+            self.root.after_cancel(self._display_job)
+            self._display_job = None
+        
+        # Delete all existing items, including rows hidden by the search, in a single call
+        self.tree.delete(*self.item_song_ids)
+        self.item_song_ids = {}
+        self.song_items = {}
+        self._shown_song_ids = None
+        
+        self._pending_songs = iter(songs)
+        self._drain_song_chunks()
+    
     def display_songs(self, songs: List[Dict[str, Any]]):
-        """Display the given list of songs in the tree view"""
-        # Remember which songs were selected
-        previously_selected = self.selected_songs.copy()
-        
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add filtered songs
-        for song in songs:
-            song_id = song['rowid']
-            is_selected = song_id in previously_selected
+        """Show only the given songs in the tree view
+        
+        Existing rows are reused: replacing the children of the root item
+        detaches the rows not listed and reattaches the listed ones in order,
+        keeping their check state. Rows still pending are not inserted here;
+        each later chunk hides its rows that are not among the given songs.
+        """
+        self._shown_song_ids = {song['rowid'] for song in songs}
+        song_items = self.song_items
+        self.tree.set_children('', *[song_items[song['rowid']] for song in songs
+                                     if song['rowid'] in song_items])
+    
+    def _drain_song_chunks(self):
+        """Insert one chunk of pending songs and schedule the next"""
+        self._display_job = None
+        if self._insert_song_chunk():
+            self._display_job = self.root.after_idle(self._drain_song_chunks)
+    
+    def _finish_song_display(self):
+        """Insert all pending songs immediately"""
+        if self._display_job:
+            self.root.after_cancel(self._display_job)
+            self._display_job = None
+        while self._insert_song_chunk():
+            pass
+    
+    def _insert_song_chunk(self) -> bool:
+        """Insert the next chunk of pending songs, return True if more remain"""
+        songs = list(islice(self._pending_songs, _DISPLAY_CHUNK_SIZE))
+        selected = self.selected_songs
+        display_values = self.display_values
+        tree = self.tree
+        
+        # Build all rows first so the insert loop only passes prepared values
+        rows = [
+            (display_values[song['rowid']],
+             (song['rowid'], 'checked' if song['rowid'] in selected else 'unchecked'))
+            for song in songs
+        ]
+        
+        # Detach the scrollbar so it is not updated for every inserted row
+        yscrollcommand = tree.cget('yscrollcommand')
+        tree.configure(yscrollcommand='')
+        try:
+            insert = tree.insert
+            item_song_ids = self.item_song_ids
+            song_items = self.song_items
+            for values, tags in rows:
+                item = insert('', 'end', values=values, tags=tags)
+                item_song_ids[item] = tags[0]
+                song_items[tags[0]] = item
             
-            item_id = self.tree.insert('', 'end', 
-                                      text='☑' if is_selected else '☐',
-                                      values=(
-                                          song['title'],
-                                          song['author'] or '-',
-                                          song['copyright'] or '-',
-                                          song['reference_number'] or '-'
-                                      ),
-                                      tags=(song_id,))
+            # Rows filtered out by the search are created hidden; songs are
+            # displayed in load order, so shown rows stay in order at the end
+            shown = self._shown_song_ids
+            if shown is not None:
+                hidden = [song_items[song['rowid']] for song in songs
+                          if song['rowid'] not in shown]
+                if hidden:
+                    tree.detach(*hidden)
+        finally:
+            tree.configure(yscrollcommand=yscrollcommand)
+        
+        return len(songs) == _DISPLAY_CHUNK_SIZE
     
     def update_result_count(self):
         """Update the result count label"""
@@ -797,12 +1086,10 @@ GitHub: https://github.com/karllinder/ewexport"""
 
     def _update_preview_for_item(self, item):
         """Fetch processed lyrics for the selected item and display preview"""
-        tags = self.tree.item(item, 'tags')
-        if not tags:
+        song_id = self.item_song_ids.get(item)
+        if song_id is None:
             return
 
-        song_id = int(tags[0])
-
         if not self.db:
             return
 
@@ -893,7 +1180,7 @@ GitHub: https://github.com/karllinder/ewexport"""
         if search_text and search_text not in self.search_history:
             self.search_history.append(search_text)
             self.update_search_combo_values()
-            self.save_search_history()
+            self._schedule_search_history_save()
     
     def update_search_combo_values(self):
         """Update the combobox dropdown with search history"""
@@ -901,8 +1188,7 @@ GitHub: https://github.com/karllinder/ewexport"""
     
     def load_search_history(self):
         """Load search history from settings file"""
-        settings_dir = Path.home() / '.ewexport'
-        settings_file = settings_dir / 'search_history.json'
+        settings_file = _SEARCH_HISTORY_FILE
         
         if settings_file.exists():
             try:
@@ -916,15 +1202,33 @@ GitHub: https://github.com/karllinder/ewexport"""
     
     def save_search_history(self):
         """Save search history to settings file"""
-        settings_dir = Path.home() / '.ewexport'
-        settings_dir.mkdir(exist_ok=True)
-        settings_file = settings_dir / 'search_history.json'
-        
-        try:
-            with open(settings_file, 'w', encoding='utf-8') as f:
-                json.dump({'search_history': list(self.search_history)}, f, indent=2)
-        except Exception:
-            pass  # Ignore errors saving history
+        if self._history_save_job:
+            self.root.after_cancel(self._history_save_job)
+            self._history_save_job = None
+        self._write_search_history(list(self.search_history))
+    
+    def _schedule_search_history_save(self):
+        """Save the search history shortly, once for several quick changes"""
+        if self._history_save_job:
+            self.root.after_cancel(self._history_save_job)
+        self._history_save_job = self.root.after(_HISTORY_SAVE_DELAY_MS,
+                                                 self._save_search_history_in_background)
+    
+    def _save_search_history_in_background(self):
+        """Write a snapshot of the search history without blocking the UI"""
+        self._history_save_job = None
+        threading.Thread(target=self._write_search_history,
+                         args=(list(self.search_history),), daemon=True).start()
+    
+    def _write_search_history(self, history: List[str]):
+        """Write the given search history to the settings file"""
+        with self._history_lock:
+            try:
+                _SEARCH_HISTORY_FILE.parent.mkdir(exist_ok=True)
+                with open(_SEARCH_HISTORY_FILE, 'w', encoding='utf-8') as f:
+                    json.dump({'search_history': history}, f, indent=2)
+            except Exception:
+                pass  # Ignore errors saving history
     
     def run(self):
         # Set initial search history dropdown values
@@ -1081,8 +1385,12 @@ GitHub: https://github.com/karllinder/ewexport"""
                 
                 # Create custom dialog with "Don't show again" option
                 dialog = tk.Toplevel(self.root)
+                # Hidden until built and centered, so it does not jump on screen
+                dialog.withdraw()
                 dialog.title("Update Available")
-                dialog.geometry("500x400")
+                x = (dialog.winfo_screenwidth() // 2) - 250
+                y = (dialog.winfo_screenheight() // 2) - 200
+                dialog.geometry(f"500x400+{x}+{y}")
                 dialog.resizable(False, False)
                 dialog.transient(self.root)
                 
@@ -1123,11 +1431,7 @@ GitHub: https://github.com/karllinder/ewexport"""
                 ttk.Button(button_frame, text="Download Update", command=download_update).pack(side=tk.LEFT, padx=5)
                 ttk.Button(button_frame, text="Not Now", command=close_dialog).pack(side=tk.LEFT, padx=5)
                 
-                # Center the dialog
-                dialog.update_idletasks()
-                x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-                y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-                dialog.geometry(f"+{x}+{y}")
+                dialog.deiconify()
         
         # Check for updates in background
         self.update_checker.check_for_updates_async(handle_update_check)
\ No newline at end of file
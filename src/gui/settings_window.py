@@ -13,10 +13,25 @@ from typing import Dict, Any, Optional
 import shutil
 from src.version import SECTION_MAPPINGS_SCHEMA_VERSION
 from src.utils.config import get_app_data_dir
+from src.gui.dialogs import center_on_parent
 from packaging import version as pkg_version
 
 logger = logging.getLogger(__name__)
 
+# Splits a section name into its base name and optional trailing number
+_SECTION_RE = re.compile(r'^(.*?)(\s+\d+)?$')
+
+# Example mappings shown on the preview tab
+_PREVIEW_EXAMPLES = (
+    ("vers 1", "Verse 1"),
+    ("refräng", "Chorus"),
+    ("brygga 2", "Bridge 2"),
+    ("förrefräng", "Pre-Chorus"),
+    ("slut", "Outro")
+)
+_PREVIEW_EXAMPLES_TEXT = "Examples of mappings:\n" + "".join(
+    f"  • {swedish} → {english}\n" for swedish, english in _PREVIEW_EXAMPLES)
+
 class SettingsWindow:
     CURRENT_VERSION = SECTION_MAPPINGS_SCHEMA_VERSION  # Imported from centralized version module
 
@@ -42,6 +57,9 @@ class SettingsWindow:
         # Track changes
         self.has_changes = False
         
+        # Preview widgets, created when the Preview & Test tab is first shown
+        self.preview_text = None
+        
         # Setup UI
         self.setup_ui()
         
@@ -69,18 +87,18 @@ class SettingsWindow:
                  wraplength=750).pack(anchor=tk.W, pady=(5, 0))
         
         # Main content area with tabs
-        notebook = ttk.Notebook(main_frame)
-        notebook.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         
         # Mappings tab
-        mappings_frame = ttk.Frame(notebook)
-        notebook.add(mappings_frame, text="Section Mappings")
+        mappings_frame = ttk.Frame(self.notebook)
+        self.notebook.add(mappings_frame, text="Section Mappings")
         self.setup_mappings_tab(mappings_frame)
         
-        # Preview tab
-        preview_frame = ttk.Frame(notebook)
-        notebook.add(preview_frame, text="Preview & Test")
-        self.setup_preview_tab(preview_frame)
+        # Preview tab is filled in the first time it is shown
+        self.preview_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.preview_frame, text="Preview & Test")
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
         
         # Bottom button bar
         button_frame = ttk.Frame(main_frame)
@@ -108,6 +126,11 @@ class SettingsWindow:
         ttk.Button(right_buttons, text="Cancel", 
                   command=self.on_close).pack(side=tk.LEFT)
     
+    def on_tab_changed(self, event=None):
+        """Build the preview tab the first time it is selected"""
+        if self.preview_text is None and self.notebook.select() == str(self.preview_frame):
+            self.setup_preview_tab(self.preview_frame)
+    
     def setup_mappings_tab(self, parent):
         """Setup the mappings configuration tab"""
         parent.columnconfigure(0, weight=1)
@@ -195,19 +218,7 @@ class SettingsWindow:
         examples_frame = ttk.LabelFrame(parent, text="Common Examples", padding="10")
         examples_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), padx=5, pady=5)
         
-        examples = [
-            ("vers 1", "Verse 1"),
-            ("refräng", "Chorus"),
-            ("brygga 2", "Bridge 2"),
-            ("förrefräng", "Pre-Chorus"),
-            ("slut", "Outro")
-        ]
-        
-        examples_text = "Examples of mappings:\n"
-        for swedish, english in examples:
-            examples_text += f"  • {swedish} → {english}\n"
-        
-        ttk.Label(examples_frame, text=examples_text, justify=tk.LEFT).pack(anchor=tk.W)
+        ttk.Label(examples_frame, text=_PREVIEW_EXAMPLES_TEXT, justify=tk.LEFT).pack(anchor=tk.W)
         
         # Initial preview
         self.update_preview()
@@ -297,6 +308,10 @@ class SettingsWindow:
     
     def update_preview(self, event=None):
         """Update the preview based on test input"""
+        if self.preview_text is None:
+            # Preview tab not built yet, it is refreshed when first shown
+            return
+        
         test_text = self.test_input.get()
         
         # Clear preview
@@ -315,7 +330,7 @@ class SettingsWindow:
         preview += "Mapping Process:\n"
 
         # Extract base name and number
-        match = re.match(r'^(.*?)(\s+\d+)?$', test_text.lower().strip())
+        match = _SECTION_RE.match(test_text.lower().strip())
         if match:
             base = match.group(1)
             number = match.group(2) or ""
@@ -332,7 +347,7 @@ class SettingsWindow:
     def apply_section_mapping(self, text: str) -> str:
         """Apply section mapping to text"""
         # Extract section name and optional number
-        match = re.match(r'^(.*?)(\s+\d+)?$', text.strip())
+        match = _SECTION_RE.match(text.strip())
         if not match:
             return text
         
@@ -645,10 +660,7 @@ class MappingDialog:
         self.dialog.grab_set()
         
         # Center on parent
-        parent.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - 200
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - 75
-        self.dialog.geometry(f"+{x}+{y}")
+        center_on_parent(self.dialog, parent, 400, 150)
         
         # Create form
         frame = ttk.Frame(self.dialog, padding="20")
@@ -14,6 +14,25 @@ from typing import List, Dict, Optional, Any
 
 logger = logging.getLogger(__name__)
 
+# Parsed section mapping files keyed by path, stored with the file's mtime so
+# edits made in the settings window are picked up on the next detection
+_mappings_cache: Dict[str, tuple] = {}
+
+
+def _read_mappings_config(config_path) -> Dict[str, Any]:
+    """Read a section mappings file, reusing the parsed result while unchanged"""
+    key = str(config_path)
+    mtime = Path(config_path).stat().st_mtime
+    
+    cached = _mappings_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    _mappings_cache[key] = (mtime, config)
+    return config
+
 
 class SectionDetector:
     """
@@ -39,10 +58,9 @@ class SectionDetector:
             config_path = app_dir / "section_mappings.json"
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                self.section_mappings = config.get('section_mappings', {})
-                self.number_rules = config.get('number_mapping_rules', {})
+            config = _read_mappings_config(config_path)
+            self.section_mappings = config.get('section_mappings', {})
+            self.number_rules = config.get('number_mapping_rules', {})
             logger.debug(f"Loaded section mappings from {config_path}")
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.warning(f"Could not load section mappings: {e}. Using defaults.")
@@ -286,6 +286,41 @@ class ConfigManager:
         
         return True
     
+    def update(self, values: Dict[str, Any], save: bool = True) -> bool:
+        """Set several setting values at once using dot notation keys
+        
+        Parent dictionaries are resolved once per distinct prefix, so keys
+        sharing a section (e.g. 'export.slides.*') are navigated only once.
+        Values equal to the current setting are skipped, and the settings
+        file is only written when something actually changed.
+        """
+        parents = {}
+        changed = False
+        
+        for key_path, value in values.items():
+            parent_path, _, key = key_path.rpartition('.')
+            target = parents.get(parent_path)
+            if target is None:
+                # Navigate to the parent of the target key
+                target = self.settings
+                if parent_path:
+                    for part in parent_path.split('.'):
+                        if part not in target:
+                            target[part] = {}
+                        target = target[part]
+                parents[parent_path] = target
+            
+            # Set the value if it differs from the current one
+            if key not in target or target[key] != value:
+                target[key] = value
+                changed = True
+        
+        # Optionally save once for all values
+        if save and changed:
+            return self.save_settings()
+        
+        return True
+    
     def get_recent_databases(self) -> list:
         """Get list of recently used database paths"""
         return self.get('paths.recent_databases', [])
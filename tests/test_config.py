@@ -225,6 +225,54 @@ class TestSettingsWindowMigration(unittest.TestCase):
             self.assertTrue(hasattr(sw, 'pkg_version'))
 
 
+class TestConfigUpdate(unittest.TestCase):
+    """Test bulk updates of settings using dot notation."""
+
+    def setUp(self):
+        """Create config manager backed by a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        with patch('utils.config.get_app_data_dir', return_value=Path(self.temp_dir)):
+            self.config_manager = ConfigManager()
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_update_sets_nested_values(self):
+        """Test that update sets values in existing and new sections."""
+        self.config_manager.update({
+            'export.font.size': 48,
+            'export.slides.max_lines_per_slide': 2,
+            'export.slides.add_blank_slide': True,
+            'new_section.option': 'value'
+        }, save=False)
+
+        self.assertEqual(self.config_manager.get('export.font.size'), 48)
+        self.assertEqual(self.config_manager.get('export.font.family'), 'Arial')
+        self.assertEqual(self.config_manager.get('export.slides.max_lines_per_slide'), 2)
+        self.assertTrue(self.config_manager.get('export.slides.add_blank_slide'))
+        self.assertEqual(self.config_manager.get('new_section.option'), 'value')
+
+    def test_update_saves_once(self):
+        """Test that update writes the settings file when save is requested."""
+        self.config_manager.update({'export.change_font': True})
+
+        with open(self.config_manager.settings_file, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        self.assertTrue(saved['export']['change_font'])
+
+    def test_update_without_changes_skips_save(self):
+        """Test that updating to the current values does not write the settings file."""
+        current = {
+            'export.font.size': self.config_manager.get('export.font.size'),
+            'export.change_font': self.config_manager.get('export.change_font')
+        }
+
+        with patch.object(self.config_manager, 'save_settings') as save_settings:
+            self.assertTrue(self.config_manager.update(current))
+            save_settings.assert_not_called()
+
+
 class TestCrossplatformPaths(unittest.TestCase):
     """Test that all modules use centralized path handling."""
 
@@ -12,6 +12,7 @@ import os
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 # Add src to path for testing
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
@@ -305,6 +306,30 @@ class TestSongProcessing(unittest.TestCase):
         self.assertIn('F\u00e5der', processed)    # Fåder
         self.assertIn('L\u00e4t', processed)      # Lät
 
+    def test_processed_song_is_cached(self):
+        """Test that repeated requests reuse the processed song."""
+        first = self.db.get_song_with_processed_lyrics(1)
+
+        self.assertIs(self.db.get_song_with_processed_lyrics(1), first)
+
+    def test_reload_section_mappings_clears_processed_songs(self):
+        """Test that songs are processed again after section mappings change."""
+        first = self.db.get_song_with_processed_lyrics(1)
+        self.db.reload_section_mappings()
+
+        second = self.db.get_song_with_processed_lyrics(1)
+        self.assertIsNot(second, first)
+        self.assertEqual(second['sections'], first['sections'])
+
+    def test_processed_song_cache_is_bounded(self):
+        """Test that the least recently used processed song is dropped first."""
+        with patch('database.easyworship._PROCESSED_SONG_CACHE_SIZE', 1):
+            first = self.db.get_song_with_processed_lyrics(1)
+            self.db.get_song_with_processed_lyrics(2)
+
+            self.assertEqual(len(self.db._processed_songs), 1)
+            self.assertIsNot(self.db.get_song_with_processed_lyrics(1), first)
+
 
 class TestSectionMappingsReload(unittest.TestCase):
     """Test section mappings reload functionality."""
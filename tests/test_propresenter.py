@@ -0,0 +1,281 @@
+"""
+Tests for ProPresenter 6 export functionality.
+
+Tests line preparation, text element encoding, and writing .pro6 files
+to a temporary directory.
+"""
+
+import unittest
+import sys
+import base64
+import tempfile
+import shutil
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from export.propresenter import ProPresenter6Exporter
+
+
+def decode_field(element, ivar_name, encoding='utf-8'):
+    """Decode a base64 encoded NSString field from a text element."""
+    for child in element.iter('NSString'):
+        if child.get('rvXMLIvarName') == ivar_name:
+            return base64.b64decode(child.text).decode(encoding)
+    return None
+
+
+class DictConfig:
+    """Minimal stand-in for ConfigManager backed by a flat dict of dotted keys."""
+
+    def __init__(self, values=None):
+        self.values = values or {}
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+class TestPrepareLines(unittest.TestCase):
+    """Test splitting and escaping of slide content."""
+
+    def setUp(self):
+        self.exporter = ProPresenter6Exporter()
+
+    def test_lines_are_split_once(self):
+        """Test that all three line lists have one entry per line."""
+        raw, rtf, xml = self.exporter._prepare_lines("one\ntwo\nthree")
+
+        self.assertEqual(raw, ["one", "two", "three"])
+        self.assertEqual(len(rtf), 3)
+        self.assertEqual(len(xml), 3)
+
+    def test_rtf_escaping(self):
+        """Test that RTF control characters are escaped."""
+        _, rtf, _ = self.exporter._prepare_lines("a\\b {c}")
+
+        self.assertEqual(rtf, ["a\\\\b \\{c\\}"])
+
+    def test_xml_escaping(self):
+        """Test that XML special characters are escaped."""
+        _, _, xml = self.exporter._prepare_lines("<a> & \"b\" 'c'")
+
+        self.assertEqual(xml, ["&lt;a&gt; &amp; &quot;b&quot; &apos;c&apos;"])
+
+    def test_swedish_characters_unchanged(self):
+        """Test that Swedish characters pass through untouched."""
+        raw, rtf, xml = self.exporter._prepare_lines("Å ä ö")
+
+        self.assertEqual(raw, rtf)
+        self.assertEqual(raw, xml)
+
+
+class TestSplitContent(unittest.TestCase):
+    """Test splitting section content into slides."""
+
+    def setUp(self):
+        self.exporter = ProPresenter6Exporter()
+
+    def test_empty_lines_break_slides(self):
+        """Test that blank lines separate slides and lines are stripped."""
+        slides = self.exporter.split_content_into_slides("  a\nb  \n\n \n c\n")
+
+        self.assertEqual(slides, ["a\nb", "c"])
+
+    def test_long_slides_are_broken_by_max_lines(self):
+        """Test that slides longer than the default four lines are split."""
+        content = "\n".join(str(i) for i in range(6))
+
+        self.assertEqual(self.exporter.split_content_into_slides(content), ["0\n1\n2\n3", "4\n5"])
+
+
+class TestTextElement(unittest.TestCase):
+    """Test encoding of slide text into a text element."""
+
+    def setUp(self):
+        self.exporter = ProPresenter6Exporter()
+
+    def test_plain_text_uses_crlf(self):
+        """Test that plain text is trimmed and uses CRLF line endings."""
+        element = self.exporter.create_text_element("  first\nsecond  ")
+
+        self.assertEqual(decode_field(element, 'PlainText'), "first\r\nsecond")
+
+    def test_plain_text_keeps_existing_crlf(self):
+        """Test that existing CRLF line endings are not doubled."""
+        element = self.exporter.create_text_element("first\r\nsecond")
+
+        self.assertEqual(decode_field(element, 'PlainText'), "first\r\nsecond")
+
+    def test_rtf_contains_escaped_lines(self):
+        """Test that RTF data contains one paragraph per line."""
+        element = self.exporter.create_text_element("{x}\ny")
+        rtf = decode_field(element, 'RTFData')
+
+        self.assertIn(r'\ltrch \{x\}}', rtf)
+        self.assertIn(r'\ltrch y}', rtf)
+        self.assertEqual(rtf.count(r'\par}'), 1)
+
+    def test_winflow_contains_escaped_lines(self):
+        """Test that WinFlow data contains one paragraph per line."""
+        element = self.exporter.create_text_element("a & b\nc")
+        winflow = decode_field(element, 'WinFlowData')
+
+        self.assertIn('>a &amp; b</Run>', winflow)
+        self.assertIn('>c</Run>', winflow)
+        self.assertEqual(winflow.count('<Paragraph '), 2)
+
+    def test_winfont_data_is_shared_utf16(self):
+        """Test that every text element shares the same UTF-16 font data string."""
+        first = self.exporter.create_text_element("a")
+        second = self.exporter.create_text_element("b")
+
+        self.assertIs(
+            next(e for e in first.iter('NSString') if e.get('rvXMLIvarName') == 'WinFontData').text,
+            next(e for e in second.iter('NSString') if e.get('rvXMLIvarName') == 'WinFontData').text)
+        self.assertIn('<RVFont ', decode_field(first, 'WinFontData', encoding='utf-16'))
+
+
+class TestExportSong(unittest.TestCase):
+    """Test writing songs to .pro6 files."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.exporter = ProPresenter6Exporter()
+        self.song = {'title': 'Amazing Grace', 'author': 'John Newton', 'reference_number': '12345'}
+        self.sections = [
+            {'type': 'Verse 1', 'content': 'Amazing grace how sweet the sound\nThat saved a wretch like me'},
+            {'type': 'chorus', 'content': 'My chains are gone'},
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_export_song_writes_file(self):
+        """Test that a song with content is written as parseable XML."""
+        success, path = self.exporter.export_song(self.song, self.sections, Path(self.temp_dir))
+
+        self.assertTrue(success)
+        root = ET.parse(path).getroot()
+        self.assertEqual(root.tag, 'RVPresentationDocument')
+        groups = [g.get('name') for g in root.iter('RVSlideGrouping')]
+        self.assertEqual(groups, ['Verse 1', 'Chorus'])
+
+    def test_empty_arrays_are_not_self_closing(self):
+        """Test that empty arrays are written with explicit closing tags."""
+        success, path = self.exporter.export_song(self.song, self.sections, Path(self.temp_dir))
+
+        content = Path(path).read_text(encoding='utf-8')
+        self.assertIn('<array rvXMLIvarName="cues"></array>', content)
+        self.assertNotIn('/>', content)
+
+    def test_export_song_is_pretty_printed(self):
+        """Test that the file starts with the XML declaration and is indented."""
+        success, path = self.exporter.export_song(self.song, self.sections, Path(self.temp_dir))
+
+        lines = Path(path).read_text(encoding='utf-8').split('\n')
+        self.assertEqual(lines[0], '<?xml version="1.0" encoding="utf-8"?>')
+        self.assertTrue(lines[1].startswith('<RVPresentationDocument '))
+        self.assertTrue(lines[2].startswith('  <RVTimeline '))
+        self.assertTrue(lines[3].startswith('    <array rvXMLIvarName="timeCues">'))
+        self.assertEqual(lines[-2], '</RVPresentationDocument>')
+        self.assertEqual(lines[-1], '')
+
+    def test_export_song_compact(self):
+        """Test that pretty=False writes the same document without indentation."""
+        success, path = self.exporter.export_song(self.song, self.sections, Path(self.temp_dir),
+                                                  pretty=False)
+
+        content = Path(path).read_text(encoding='utf-8')
+        self.assertEqual(content.count('\n'), 1)
+        self.assertIn('<array rvXMLIvarName="cues"></array>', content)
+        root = ET.fromstring(content.encode('utf-8'))
+        self.assertEqual(len(list(root.iter('RVDisplaySlide'))), 2)
+
+    def test_export_song_without_content_fails(self):
+        """Test that songs without lyrics are rejected."""
+        success, message = self.exporter.export_song(self.song, [], Path(self.temp_dir))
+
+        self.assertFalse(success)
+        self.assertIn('no lyrics', message)
+
+
+class TestExportSongsBatch(unittest.TestCase):
+    """Test batch export to a temporary directory."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = Path(self.temp_dir)
+        self.songs = [
+            ({'title': 'First Song', 'rowid': 1}, [{'type': 'verse', 'content': 'Line one\nLine two'}]),
+            ({'title': 'Second Song', 'rowid': 2}, [{'type': 'chorus', 'content': 'Sing along'}]),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_batch_writes_all_songs(self):
+        """Test that every song in the batch is written to its own file."""
+        exporter = ProPresenter6Exporter()
+        successful, failed, skipped = exporter.export_songs_batch(self.songs, self.output_path)
+
+        self.assertEqual(len(successful), 2)
+        self.assertEqual(failed, [])
+        self.assertEqual(skipped, [])
+        self.assertTrue((self.output_path / 'First Song.pro6').exists())
+        self.assertTrue((self.output_path / 'Second Song.pro6').exists())
+
+    def test_blank_and_intro_slides_are_not_self_closing(self):
+        """Test that empty slides added by config keep explicit closing tags."""
+        config = DictConfig({
+            'export.slides.add_intro_slide': True,
+            'export.slides.add_blank_slide': True,
+        })
+        exporter = ProPresenter6Exporter(config)
+        exporter.export_songs_batch(self.songs[:1], self.output_path)
+
+        content = (self.output_path / 'First Song.pro6').read_text(encoding='utf-8')
+        root = ET.fromstring(content.encode('utf-8'))
+        groups = [g.get('name') for g in root.iter('RVSlideGrouping')]
+        self.assertEqual(groups, ['Intro', 'Verse', 'Blank'])
+        self.assertNotIn('/>', content)
+
+    def test_large_batch_renames_duplicates_in_order(self):
+        """Test that duplicates within one batch are renamed in song order."""
+        config = DictConfig({'export.duplicate_handling_action': 'rename'})
+        exporter = ProPresenter6Exporter(config)
+        songs = [({'title': 'Same Title', 'rowid': i}, [{'type': 'verse', 'content': f'Line {i}'}])
+                 for i in range(25)]
+        progress = []
+
+        successful, failed, skipped = exporter.export_songs_batch(
+            songs, self.output_path, progress_callback=lambda i, total, title: progress.append(i))
+
+        self.assertEqual(len(successful), 25)
+        self.assertEqual(failed, [])
+        self.assertEqual(progress, list(range(26)))
+        self.assertTrue((self.output_path / 'Same Title.pro6').exists())
+        self.assertTrue((self.output_path / 'Same Title_24.pro6').exists())
+        root = ET.parse(self.output_path / 'Same Title_3.pro6').getroot()
+        text = decode_field(next(root.iter('RVTextElement')), 'PlainText')
+        self.assertEqual(text, 'Line 3')
+
+    def test_large_batch_guids_are_unique(self):
+        """Test that every slide in a batch gets its own GUID."""
+        exporter = ProPresenter6Exporter()
+        songs = [({'title': f'Song {i}', 'rowid': i}, [{'type': 'verse', 'content': 'Same line'}])
+                 for i in range(25)]
+
+        exporter.export_songs_batch(songs, self.output_path)
+
+        guids = []
+        for path in self.output_path.glob('*.pro6'):
+            root = ET.parse(path).getroot()
+            guids.extend(e.get('UUID') for e in root.iter('RVDisplaySlide'))
+        self.assertEqual(len(guids), 25)
+        self.assertEqual(len(set(guids)), 25)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,8 @@ and EasyWorship-specific RTF formatting.
 import unittest
 import sys
 import os
+import json
+import tempfile
 from pathlib import Path
 
 # Add src to path for testing
@@ -185,6 +187,23 @@ And appears again"""
         if result['has_sections']:
             chorus_sections = [s for s in result['sections'] if s['type'] == 'chorus']
             self.assertTrue(len(chorus_sections) >= 1)
+    
+    def test_mappings_file_reread_after_change(self):
+        """Test that a changed mappings file is picked up by new detectors."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / 'section_mappings.json'
+            config_path.write_text(json.dumps({'section_mappings': {'vers': 'Verse'}}), encoding='utf-8')
+            first = SectionDetector(str(config_path))
+            second = SectionDetector(str(config_path))
+            
+            # Unchanged file is parsed once and shared
+            self.assertIs(first.section_mappings, second.section_mappings)
+            
+            config_path.write_text(json.dumps({'section_mappings': {'vers': 'Strophe'}}), encoding='utf-8')
+            mtime = config_path.stat().st_mtime + 10
+            os.utime(config_path, (mtime, mtime))
+            
+            self.assertEqual(SectionDetector(str(config_path)).section_mappings, {'vers': 'Strophe'})
 
 
 class TestTextCleaner(unittest.TestCase):